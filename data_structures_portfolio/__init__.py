@@ -0,0 +1,52 @@
+# Course: CS261 - Data Structures
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Package of graph data structures; submodules load on first use of the names they provide
+
+
+import importlib
+
+__version__ = '0.1.0'
+
+# {public name: submodule defining it}; nothing is imported until a name is first used
+_EXPORTS = {
+    'Stack': 'stack',
+    'DirectedGraph': 'd_graph',
+    'DirectedSubgraphView': 'd_graph',
+    'FrozenDirectedGraph': 'd_graph',
+    'ShortestPathCache': 'd_graph',
+    'ShortestPathTree': 'd_graph',
+    'UndirectedGraph': 'ud_graph',
+    'UndirectedSubgraphView': 'ud_graph',
+    'FrozenUndirectedGraph': 'ud_graph',
+    'ReadWriteLock': 'concurrent_graph',
+    'SynchronizedGraph': 'concurrent_graph',
+    'GraphQueryService': 'query_service',
+    'parallel_bfs': 'parallel_graph',
+    'parallel_connected_components': 'parallel_graph',
+    'LandmarkIndex': 'landmark_index',
+    'TraceRecorder': 'workload',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """
+    Imports the submodule that defines a public name, the first time the name is used
+    :param name: string naming an attribute of the package
+    :return: the attribute
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+
+    # remember it, so later lookups skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS))
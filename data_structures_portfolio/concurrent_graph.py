@@ -0,0 +1,179 @@
+# Course: CS261 - Data Structures
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Implements a reader-writer lock and a thread-safe wrapper for DirectedGraph and UndirectedGraph
+
+
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """
+    Class to implement a reader-writer lock
+    - any number of readers may hold the lock at once
+    - a writer holds the lock alone
+    - waiting writers block new readers, so a steady stream of reads cannot starve a writer
+    - not reentrant: a thread holding the lock must not acquire it again
+    """
+
+    def __init__(self):
+        """
+        Initializes the lock in the unlocked state
+        """
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    def acquire_read(self) -> None:
+        """
+        Blocks until the lock can be shared with other readers
+        """
+        with self._condition:
+            while self._writing or self._writers_waiting > 0:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """
+        Releases a shared hold on the lock
+        """
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Blocks until the lock can be held exclusively
+        """
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writing or self._readers > 0:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+
+    def release_write(self) -> None:
+        """
+        Releases an exclusive hold on the lock
+        """
+        with self._condition:
+            self._writing = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def reading(self):
+        """
+        Holds the lock shared for the duration of a with block
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def writing(self):
+        """
+        Holds the lock exclusively for the duration of a with block
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class SynchronizedGraph:
+    """
+    Class to implement a thread-safe wrapper around a DirectedGraph or UndirectedGraph
+    - mutating methods run under an exclusive lock
+    - every other method runs under a shared lock, so queries run concurrently with each other
+    - snapshot() hands out frozen copies, so long-running readers need not hold the lock at all
+    """
+    WRITE_METHODS = frozenset(['add_vertex', 'add_edge', 'remove_edge', 'remove_vertex',
+                               'enable_dijkstra_cache', 'disable_dijkstra_cache',
+                               'attach_observer', 'detach_observer'])
+
+    def __init__(self, graph):
+        """
+        Wraps a graph
+        The wrapped graph must not be used directly while the wrapper is in use
+        :param graph: DirectedGraph or UndirectedGraph to protect
+        """
+        self._graph = graph
+        self._lock = ReadWriteLock()
+        self._version = 0
+        self._snapshot = (-1, None)  # (version, frozen graph), swapped as one reference
+
+    def __getattr__(self, name):
+        """
+        Looks up a method of the wrapped graph and wraps it in the matching lock
+        :param name: string naming an attribute of the wrapped graph
+        :return: locked version of the attribute if it is callable; otherwise its value, read under the lock
+        """
+        with self._lock.reading():
+            attribute = getattr(self._graph, name)
+
+        if not callable(attribute):
+            return attribute
+
+        if name in self.WRITE_METHODS:
+            def locked(*args, **kwargs):
+                with self._lock.writing():
+                    self._version += 1
+                    return attribute(*args, **kwargs)
+        else:
+            def locked(*args, **kwargs):
+                with self._lock.reading():
+                    return attribute(*args, **kwargs)
+
+        return locked
+
+    def __str__(self):
+        with self._lock.reading():
+            return str(self._graph)
+
+    @property
+    def version(self) -> int:
+        """
+        Counts the write operations applied through this wrapper
+        """
+        return self._version
+
+    @contextmanager
+    def batch(self):
+        """
+        Holds the exclusive lock for a group of updates, yielding the wrapped graph
+        Call methods on the yielded graph, not on this wrapper, inside the with block
+        """
+        with self._lock.writing():
+            self._version += 1
+            yield self._graph
+
+    @contextmanager
+    def reading(self):
+        """
+        Holds the shared lock for a group of queries that must see the same state, yielding the wrapped graph
+        Only call query methods on the yielded graph inside the with block
+        """
+        with self._lock.reading():
+            yield self._graph
+
+    def snapshot(self):
+        """
+        Returns a frozen copy of the current graph
+        The copy is only rebuilt after a write, so readers between writes share one snapshot
+        :return: FrozenDirectedGraph or FrozenUndirectedGraph
+        """
+        with self._lock.reading():
+            version, snapshot = self._snapshot
+            if version != self._version:
+                version = self._version
+                snapshot = self._graph.freeze()
+                # racing readers may each publish; a stale publish only costs one rebuild later
+                self._snapshot = (version, snapshot)
+
+        return snapshot
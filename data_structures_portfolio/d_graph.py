@@ -0,0 +1,1606 @@
+# Course: CS261 - Data Structures
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Implements a class for creating, manipulating, and querying a directed graph
+
+
+from .stack import Stack
+from .paths import flatten_paths
+from collections import deque, OrderedDict
+from heapq import heapify, heappush, heappop
+from array import array
+from bisect import bisect_left
+import sys
+import threading
+
+
+class DirectedGraph:
+    """
+    Class to implement directed weighted graph
+    - duplicate edges not allowed
+    - loops not allowed
+    - only positive edge weights
+    - vertex names are integers
+    """
+    # mutation counter and change listeners; instances get their own once the graph first changes
+    _version = 0
+    _observers = ()
+    _dijkstra_cache = None
+
+    def __init__(self, start_edges=None):
+        """
+        Store graph info as adjacency matrix
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        self.v_count = 0
+        self.adj_matrix = []
+
+        # populate graph with initial vertices and edges (if provided)
+        # before using, implement add_vertex() and add_edge() methods
+        if start_edges is not None:
+            v_count = 0
+            for u, v, _ in start_edges:
+                v_count = max(v_count, u, v)
+            for _ in range(v_count + 1):
+                self.add_vertex()
+            for u, v, weight in start_edges:
+                self.add_edge(u, v, weight)
+
+    def __str__(self):
+        """
+        Return content of the graph in human-readable form
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        if self.v_count == 0:
+            return 'EMPTY GRAPH\n'
+        out = '   |'
+        out += ' '.join(['{:2}'.format(i) for i in range(self.v_count)]) + '\n'
+        out += '-' * (self.v_count * 3 + 3) + '\n'
+        for i in range(self.v_count):
+            row = self.adj_matrix[i]
+            out += '{:2} |'.format(i)
+            out += ' '.join(['{:2}'.format(w) for w in row]) + '\n'
+        out = f"GRAPH ({self.v_count} vertices):\n{out}"
+        return out
+
+    # ------------------------------------------------------------------ #
+
+    def add_vertex(self) -> int:
+        """
+        Adds a new unnamed vertex to the graph
+        First vertex created in the graph will be assigned index 0, subsequent vertices will have indexes 1, 2, 3 etc.
+        :return: int showing the number of vertices in the graph, including the new one
+        """
+        # handle adding first vertex
+        if self.v_count == 0:
+            self.adj_matrix.append([0])
+            self.v_count += 1
+            self._notify_vertex_added()
+            return self.v_count
+
+        # label each existing vertex as not connected to the new one
+        for neighbor_group in self.adj_matrix:
+            neighbor_group.append(0)
+
+        # add the new vertex
+        new_length = len(self.adj_matrix[0])
+        new_list = [0 for index in range(new_length)]
+        self.adj_matrix.append(new_list)
+
+        # update member variable counting vertices
+        self.v_count += 1
+
+        self._notify_vertex_added()
+
+        return self.v_count
+
+    def vertices_are_valid(self, src: int, dst: int = None) -> bool:
+        """
+        Validates two vertices
+        :param src: int identifying a vertex
+        :param dst: int identifying a different vertex
+        :return: True if the vertices are valid; False otherwise
+        """
+        # check for out-of-bounds src
+        if src >= self.v_count or src < 0:
+            return False
+
+        if dst is not None:
+            # check for out-of-bounds dst
+            if dst >= self.v_count or dst < 0:
+                return False
+
+            # check for same indices
+            if src == dst:
+                return False
+
+        # passed tests; vertices are valid
+        return True
+
+    def add_edge(self, src: int, dst: int, weight=1) -> None:
+        """
+        Adds a new edge to the graph, connecting two vertices with provided indices
+        If a vertex index does not exist in the graph
+            or the weight is not a positive integer
+            or src and dst are the same vertex,
+            nothing happens
+        If an edge already exists in the graph, its weight will be updated
+        :param src: int identifying the vertex to which the edge will be added
+        :param dst: int identifying the vertex which will be added to src as the new edge
+        :param weight: (optional) int representing the weight of the new edge. If not provided, it is 1
+        """
+        if not self.vertices_are_valid(src, dst):
+            return
+
+        # check for invalid weight
+        if weight < 1:
+            return
+
+        # update src -> dst weight
+        old_weight = self.adj_matrix[src][dst]
+        self.adj_matrix[src][dst] = weight
+        if old_weight != weight:
+            self._notify_edge_changed(src, dst, old_weight, weight)
+
+    def remove_edge(self, src: int, dst: int) -> None:
+        """
+        Removes an edge between two vertices with provided indices
+        If an index does not exist in the graph
+            or if there is no edge between them
+            or if src and dst are the same vertex,
+            nothing happens
+        :param src: int identifying the vertex from which the edge will be removed
+        :param dst: int identifying the vertex which will be removed from src as the edge
+        """
+        if not self.vertices_are_valid(src, dst):
+            return
+
+        old_weight = self.adj_matrix[src][dst]
+        self.adj_matrix[src][dst] = 0
+        if old_weight != 0:
+            self._notify_edge_changed(src, dst, old_weight, 0)
+
+    @property
+    def version(self) -> int:
+        """
+        Counts the changes made to the graph through its methods
+        """
+        return self._version
+
+    def attach_observer(self, observer) -> None:
+        """
+        Registers an object to be told about every change to the graph
+        Observers provide vertex_added(), edge_changed(src, dst, old_weight, new_weight)
+            where a weight of 0 means there is no edge
+        :param observer: object to notify
+        """
+        # replace the tuple rather than appending, so notifications in progress are unaffected
+        self._observers = self._observers + (observer,)
+
+    def detach_observer(self, observer) -> None:
+        """
+        Stops notifying an observer
+        If the observer is not attached, nothing happens
+        :param observer: object previously passed to attach_observer()
+        """
+        self._observers = tuple(existing for existing in self._observers if existing is not observer)
+
+    def _notify_vertex_added(self) -> None:
+        """
+        Bumps the version and tells observers a vertex was added
+        """
+        self._version += 1
+        for observer in self._observers:
+            observer.vertex_added()
+
+    def _notify_edge_changed(self, src: int, dst: int, old_weight, new_weight) -> None:
+        """
+        Bumps the version and tells observers an edge was added, removed, or reweighted
+        :param src: int identifying the edge's source vertex
+        :param dst: int identifying the edge's destination vertex
+        :param old_weight: weight before the change, or 0 if there was no edge
+        :param new_weight: weight after the change, or 0 if the edge was removed
+        """
+        self._version += 1
+        for observer in self._observers:
+            observer.edge_changed(src, dst, old_weight, new_weight)
+
+    def get_vertices(self) -> []:
+        """
+        Returns an unordered list of vertices in the graph
+        :return: list of int vertices in the graph, unordered
+        """
+        return [vertex for vertex in range(len(self.adj_matrix))]
+
+    def get_edges(self) -> []:
+        """
+        Returns an unordered list of edges in the graph
+        Edges are tuples with the form (source, destination, weight), where:
+            source is the source vertex
+            destination is the destination vertex
+            weight is the weight of the edge
+        :return: list of edges in the graph, as unordered tuples of ints
+        """
+        # get all of the graph's vertices
+        edges = []
+        for outer_vertex in range(len(self.adj_matrix)):
+            # get all of this source vertex's neighbors and their edge weights, adding each edge
+            new_edges = self.get_direct_edges(outer_vertex)
+            edges.extend(new_edges)
+
+        return edges
+
+    def get_direct_edges(self, vertex: int) -> list:
+        """
+        Returns an unordered list of edges connected to one vertex
+        Edges are tuples with the form (source, destination, weight), where:
+            source is the source vertex
+            destination is the destination vertex
+            weight is the weight of the edge
+        :param vertex: int
+        :return: list of edges in the graph, as unordered tuples of ints
+        """
+        edges = []
+        neighbor_group = self.adj_matrix[vertex]
+
+        # get all of this source vertex's neighbors and their edge weights, adding each edge
+        for index in range(len(neighbor_group)):
+            weight = self.adj_matrix[vertex][index]
+
+            # if there is a weight, there is an edge; add it to the list
+            if weight > 0:
+                edge = (vertex, index, weight)
+                edges.append(edge)
+
+        return edges
+
+    def get_children(self, vertex: int) -> list:
+        """
+        Returns a vertex's children
+        :param vertex: int vertex whose children will be returned
+        :return: list of ints identifying the given vertex's child vertices
+        """
+        return [child for child in range(len(self.adj_matrix[vertex])) if self.adj_matrix[vertex][child] > 0]
+
+    def get_parents(self, vertex: int) -> list:
+        """
+        Returns a vertex's parents
+        :param vertex: int vertex whose parents will be returned
+        :return: list of ints identifying the vertices with an edge to the given vertex
+        """
+        return [parent for parent in range(self.v_count) if self.adj_matrix[parent][vertex] > 0]
+
+    def is_valid_path(self, path: []) -> bool:
+        """
+        Checks whether a given path is valid in the graph
+        Empty paths are considered valid
+        :param path: list of ints identifying vertices in the path
+        :return: True if the path is valid; False otherwise
+        """
+        # handle empty path
+        if len(path) == 0:
+            return True
+
+        # travel along the given path
+        for index in range(len(path) - 1):  # -1 because loop reaches forward
+            vertex = path[index]
+            next_vertex = path[index + 1]
+
+            # validate vertices
+            if not self.vertices_are_valid(vertex, next_vertex):
+                return False
+
+            # check to make sure these vertices are connected by an edge
+            if self.adj_matrix[vertex][next_vertex] < 1:
+                return False
+
+        # passed the above test, so path is valid
+        return True
+
+    def validate_paths(self, paths, offsets=None) -> tuple:
+        """
+        Checks many paths at once, with the same rules as is_valid_path()
+        Paths are given either as a list of paths, or as one flat list of vertices plus offsets,
+            where path i is paths[offsets[i]:offsets[i + 1]]
+        :param paths: list of lists of ints, or flat list of ints if offsets is given
+        :param offsets: (optional) list of path count + 1 ints marking where each path starts in paths;
+            they must not decrease or run past the end of paths, or ValueError is raised
+        :return: tuple of (list of bools, one per path, True where the path is valid,
+                           list of ints, one per path: the position of the first vertex that can't be reached,
+                           0 if the path's first vertex is not in the graph, or -1 if the path is valid)
+        """
+        flat, offsets = flatten_paths(paths, offsets)
+
+        # bind lookups once, since this loop runs once per hop of every path
+        matrix = self.adj_matrix
+        v_count = self.v_count
+        valid = []
+        failures = []
+
+        for path_index in range(len(offsets) - 1):
+            start, end = offsets[path_index], offsets[path_index + 1]
+            failure = -1
+
+            for index in range(start, end - 1):
+                vertex, next_vertex = flat[index], flat[index + 1]
+                if not 0 <= vertex < v_count:
+                    failure = index - start
+                    break
+                if not 0 <= next_vertex < v_count or vertex == next_vertex or matrix[vertex][next_vertex] < 1:
+                    failure = index + 1 - start
+                    break
+
+            valid.append(failure == -1)
+            failures.append(failure)
+
+        return valid, failures
+
+    def dfs(self, v_start: int, v_end: int = None) -> []:
+        """
+        Return list of vertices visited during DFS search, in visitation order
+        Vertices are picked least to greatest
+        If the starting vertex is not in the graph, returns an empty list
+        :param v_start: int identifying the starting vertex
+        :param v_end: (optional) int identifying the vertex after which to end the search early
+                      if v_end is not in the graph, the whole graph is searched
+        :return: list of ints identifying the visited vertices, or empty list if v_start isn't in the graph
+        """
+        # make sure v_start is in the graph
+        if not self.vertices_are_valid(v_start):
+            return []
+
+        # make a set of visited vertices
+        visited = set()
+        visited.add(v_start)
+
+        # make a stack of vertices to visit
+        to_visit = Stack([v_start])
+
+        # visit all direct successors in order
+        vertex = v_start
+        while not to_visit.is_empty() and vertex != v_end:
+            # get a vertex to visit
+            vertex = to_visit.pop()
+
+            # mark this vertex as visited (if it hasn't been counted yet)
+            if vertex not in visited:
+                visited.add(vertex)
+
+            # search unvisited direct successors for the next vertex
+            successors_ordered = self.get_children(vertex)
+            successors_ordered.sort(reverse=True)
+            for potential_successor in successors_ordered:
+                if potential_successor not in visited and self.adj_matrix[vertex][potential_successor] > 0:
+                    # keep a trail of breadcrumbs for backtracking
+                    to_visit.push(potential_successor)
+
+        return visited
+
+    def bfs(self, v_start, v_end=None) -> []:
+        """
+        Returns a list of vertices visited during BFS search, in visitation order
+        Vertices are picked least to greatest
+        If the starting vertex is not in the graph, returns an empty list
+        :param v_start: int identifying the starting vertex
+        :param v_end: (optional) int identifying the vertex after which to end the search early
+                      if v_end is not in the graph, the whole graph is searched
+        :return: list of ints identifying the visited vertices, or empty list if v_start isn't in the graph
+        """
+        # make sure v_start is in the graph
+        if not self.vertices_are_valid(v_start):
+            return []
+
+        # make a list of visited vertices
+        visited = set()
+
+        # make a dequeue of vertices to visit, used in loop
+        to_visit = deque([v_start])
+
+        # visit all direct successors of each vertex in order
+        vertex = v_start
+        while len(to_visit) != 0 and vertex != v_end:
+            # get the next vertex
+            vertex = to_visit.popleft()
+
+            # mark this vertex as visited
+            visited.add(vertex)
+
+            # visit all unvisited direct successors and insert them into the queue
+            successors_ordered = self.get_children(vertex)
+            for successor in successors_ordered:
+                # add this vertex to the itinerary for visiting later, in case it has unvisited descendants
+                if successor not in visited and successor not in to_visit and self.adj_matrix[vertex][successor] > 0:
+                    to_visit.append(successor)
+
+        return visited
+
+    def seek_cycle(self, vertex: int, exploring: set, explored: set) -> bool:
+        """
+        Based on https://stackoverflow.com/a/31543297/14257952
+        :param vertex: string identifying the next vertex to visit
+        :param exploring: set memoizing vertices whose child paths are still being explored
+        :param explored: set memoizing fully explored vertices
+        :return: True if a cycle was found; None otherwise
+        """
+        # mark this index as visited
+        exploring.add(vertex)
+
+        # recursive case: search all direct descendants, and visit all which are unvisited
+        successors = self.adj_matrix[vertex]  # get the list of edges
+        for next_vertex in range(len(successors)):  # get the vertices from the list
+            # make sure this vertex actually is a child of the one being checked
+            if self.adj_matrix[vertex][next_vertex] > 0:
+                # base case 1: if this child vertex has been visited but its path isn't done being explored,
+                # found a cycle
+                if next_vertex in exploring:
+                    return True
+
+                # recursive case: if this child vertex is not fully explored, check its children
+                elif next_vertex not in explored:
+                    if self.seek_cycle(next_vertex, exploring, explored) is True:
+                        return True
+
+        # this vertex is done; mark it as done and continue searching
+        explored.add(vertex)
+        exploring.remove(vertex)
+
+        # base case 2: visited all vertices in this connected component
+        return False
+
+    def has_cycle(self):
+        """
+        Detects whether the graph contains a cycle
+        :return: True if the graph contains a cycle; False otherwise
+        """
+        # check every vertex in the graph for a cycle, in case graph is not a complete graph
+        for v_start in self.get_vertices():
+            if self.seek_cycle(v_start, set(), set()) is True:
+                return True
+
+        # passed the test; graph is acyclic
+        return False
+
+    def dijkstra(self, src: int) -> []:
+        """
+        Computes the length of the shortest path from a given vertex to all other vertices in the graph
+        If a certain vertex is not reachable from src, its path's value is infinity
+        :param src: int identifying the source vertex from which to measure paths
+        :return: list with one value per vertex in the graph, where
+            the value at index 0 is the length of the shortest path from vertex SRC to vertex 0,
+            the value at index 1 is the length of the shortest path from vertex SRC to vertex 1, etc.
+        """
+        # reuse an earlier answer if the graph hasn't changed in a way that affects it
+        cache = self._dijkstra_cache
+        version = self.version
+        if cache is not None:
+            cached = cache.get(src)
+            if cached is not None:
+                return cached
+
+        # track visited vertices. Vertices are stored as {vertex: min_distance_to_the_vertex}
+        visited = {}
+
+        # track vertices to be visited later
+        to_visit = [(0, src)]  # paths are stored as (min_distance_to_vertex, vertex)
+        heapify(to_visit)
+
+        # find shortest distance to each node
+        while len(to_visit) > 0:
+            # get a vertex and its distance
+            distance, vertex = heappop(to_visit)
+
+            if vertex not in visited:
+                # mark this vertex as visited
+                visited[vertex] = distance
+
+                # calculate heights for this vertex's children and set them to be visited later, for their children
+                for successor in self.get_children(vertex):
+                    child_distance = self.adj_matrix[vertex][successor]
+                    total_distance = child_distance + distance  # min distance to this vertex
+                    new_entry = (total_distance, successor)
+                    heappush(to_visit, new_entry)
+
+        # fill visited dict with infinities where it's missing an entry
+        for vertex in self.get_vertices():
+            if vertex not in visited:
+                visited[vertex] = float('inf')
+
+        # convert dict to list of distances, ordering by vertex
+        list_out = []
+        for vertex in sorted(visited):
+            list_out.append(visited[vertex])
+
+        if cache is not None:
+            cache.put(src, list_out, version)
+
+        return list_out
+
+    def bounded_dijkstra(self, sources, max_distance=None, max_settled: int = None, targets=None) -> dict:
+        """
+        Computes shortest path lengths from the nearest of several sources, stopping as early as allowed
+        The search stops once every remaining vertex is farther than max_distance,
+            once max_settled vertices (or targets, if given) are settled,
+            or once every target is settled
+        :param sources: int identifying one source vertex, or iterable of ints identifying several
+        :param max_distance: (optional) number; vertices farther than this are not reported
+        :param max_settled: (optional) int limit on the number of vertices (or targets, if given) reported
+        :param targets: (optional) set of ints; if given, only these vertices are reported
+        :return: dict of {vertex: distance from the nearest source}, nearest first, without unreachable vertices
+        """
+        matrix = self.adj_matrix
+        return _bounded_search(lambda vertex: [(child, matrix[vertex][child]) for child in self.get_children(vertex)],
+                               self.vertices_are_valid, sources, max_distance, max_settled, targets)
+
+    def enable_dijkstra_cache(self, max_entries: int = 128, max_bytes: int = None) -> 'ShortestPathCache':
+        """
+        Makes dijkstra() remember its results in a least-recently-used cache
+        Replaces any cache enabled earlier
+        :param max_entries: (optional) int limit on the number of sources remembered
+        :param max_bytes: (optional) int limit on the approximate memory used by remembered results
+        :return: the new ShortestPathCache, for inspecting hit counts
+        """
+        self.disable_dijkstra_cache()
+        self._dijkstra_cache = ShortestPathCache(self, max_entries, max_bytes)
+        self.attach_observer(self._dijkstra_cache)
+        return self._dijkstra_cache
+
+    def disable_dijkstra_cache(self) -> None:
+        """
+        Stops caching dijkstra() results and frees the cache
+        If no cache is enabled, nothing happens
+        """
+        if self._dijkstra_cache is not None:
+            self.detach_observer(self._dijkstra_cache)
+            self._dijkstra_cache = None
+
+    def reorder(self, strategy: str = 'rcm') -> tuple:
+        """
+        Returns a snapshot of the graph with the vertices renumbered so connected vertices get nearby numbers
+        The graph itself keeps its numbering; only the snapshot's compressed rows gain the locality
+        Edge direction is ignored when deciding which vertices are near each other
+        :param strategy: (optional) one of
+            'bfs': breadth-first order from the lowest-numbered vertex of each component
+            'rcm': reverse Cuthill-McKee, which keeps the matrix close to its diagonal
+            'degree': most-connected vertices first
+        :return: tuple of (FrozenDirectedGraph with the new numbering,
+                           list where element i is the number of snapshot vertex i in this graph)
+        """
+        # symmetric neighbor lists, so locality doesn't depend on edge direction
+        neighbors = [[] for _ in range(self.v_count)]
+        for src in range(self.v_count):
+            row = self.adj_matrix[src]
+            for dst in range(self.v_count):
+                if row[dst] > 0 or self.adj_matrix[dst][src] > 0:
+                    neighbors[src].append(dst)
+
+        if strategy == 'degree':
+            order = sorted(range(self.v_count), key=lambda vertex: -len(neighbors[vertex]))
+        elif strategy == 'bfs':
+            order = self._breadth_first_order(neighbors, range(self.v_count), lambda vertex: vertex)
+        elif strategy == 'rcm':
+            # start each component from a least-connected vertex, visiting less-connected neighbors first
+            by_degree = sorted(range(self.v_count), key=lambda vertex: len(neighbors[vertex]))
+            order = self._breadth_first_order(neighbors, by_degree, lambda vertex: len(neighbors[vertex]))
+            order.reverse()
+        else:
+            raise ValueError(f'unknown strategy {strategy!r}')
+
+        new_number = [0] * self.v_count
+        for vertex, old_vertex in enumerate(order):
+            new_number[old_vertex] = vertex
+
+        # flatten row order[i] into run i, with successors sorted by their new numbers
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = []
+        for old_vertex in order:
+            row = self.adj_matrix[old_vertex]
+            for dst in sorted(new_number[dst] for dst in range(self.v_count) if row[dst] > 0):
+                targets.append(dst)
+                weights.append(row[order[dst]])
+            offsets.append(len(targets))
+
+        return FrozenDirectedGraph(self.v_count, offsets, targets, weights), order
+
+    @staticmethod
+    def _breadth_first_order(neighbors: list, starts, rank) -> list:
+        """
+        Lists every vertex in breadth-first order, starting a new search for each unreached component
+        Helper for reorder()
+        :param neighbors: list of lists of int neighbors, indexed by vertex
+        :param starts: iterable of ints giving the order in which to try component start vertices
+        :param rank: function used as a sort key to pick the order in which a vertex's neighbors are queued
+        :return: list of every int vertex
+        """
+        order = []
+        reached = [False] * len(neighbors)
+
+        for start in starts:
+            if reached[start]:
+                continue
+
+            reached[start] = True
+            to_visit = deque([start])
+            while len(to_visit) > 0:
+                vertex = to_visit.popleft()
+                order.append(vertex)
+                for neighbor in sorted(neighbors[vertex], key=rank):
+                    if not reached[neighbor]:
+                        reached[neighbor] = True
+                        to_visit.append(neighbor)
+
+        return order
+
+    def subgraph(self, vertices=None, min_weight=None, max_weight=None) -> 'DirectedSubgraphView':
+        """
+        Returns a read-only view of part of the graph, filtered on the fly without copying
+        The view follows later changes to this graph; vertices keep their numbers
+        :param vertices: (optional) iterable of ints; if given, only these vertices and the edges between them are kept
+        :param min_weight: (optional) number; if given, lighter edges are hidden
+        :param max_weight: (optional) number; if given, heavier edges are hidden
+        :return: DirectedSubgraphView supporting the query methods of DirectedGraph
+        """
+        return DirectedSubgraphView(self, vertices, min_weight, max_weight)
+
+    @classmethod
+    def from_edges(cls, v_count: int, edges) -> 'DirectedGraph':
+        """
+        Builds a graph in one pass, without growing the matrix one add_vertex() at a time
+        Edges follow the same rules as add_edge(): invalid ones are skipped, and a repeated edge keeps its last weight
+        :param v_count: int count of vertices, numbered 0 to v_count - 1
+        :param edges: iterable of (source, destination, weight) tuples
+        :return: new DirectedGraph
+        """
+        graph = cls()
+        graph.adj_matrix = [[0] * v_count for _ in range(v_count)]
+        graph.v_count = v_count
+
+        for src, dst, weight in edges:
+            if graph.vertices_are_valid(src, dst) and weight >= 1:
+                graph.adj_matrix[src][dst] = weight
+
+        return graph
+
+    def induced_subgraph(self, vertices) -> 'DirectedGraph':
+        """
+        Copies the part of the graph spanned by some vertices into a new, compact graph in one pass
+        The kept vertices are renumbered 0, 1, 2, etc. in ascending order of their old numbers
+        :param vertices: iterable of ints; vertices not in the graph are ignored
+        :return: new DirectedGraph where vertex i is sorted(kept vertices)[i]
+        """
+        kept = sorted(set(vertex for vertex in vertices if self.vertices_are_valid(vertex)))
+
+        # build the smaller matrix directly, rather than growing it one add_vertex() at a time
+        subgraph = DirectedGraph()
+        subgraph.adj_matrix = [[self.adj_matrix[src][dst] for dst in kept] for src in kept]
+        subgraph.v_count = len(kept)
+
+        return subgraph
+
+    def freeze(self) -> 'FrozenDirectedGraph':
+        """
+        Returns an immutable snapshot of the graph for read-only queries
+        Later changes to this graph do not affect the snapshot
+        :return: FrozenDirectedGraph holding the current vertices and edges
+        """
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = []
+
+        # flatten each row of the matrix into a run of (successor, weight) pairs, least successor first
+        for vertex in range(self.v_count):
+            row = self.adj_matrix[vertex]
+            for successor in range(self.v_count):
+                if row[successor] > 0:
+                    targets.append(successor)
+                    weights.append(row[successor])
+            offsets.append(len(targets))
+
+        return FrozenDirectedGraph(self.v_count, offsets, targets, weights)
+
+
+class DirectedSubgraphView(DirectedGraph):
+    """
+    Class to implement a read-only view of part of a DirectedGraph
+    - hidden vertices and edges are filtered out on each access; nothing is copied
+    - vertices keep their numbers from the parent graph, so hidden vertices are simply unreachable
+    - changes to the parent graph show through immediately
+    - use DirectedGraph.induced_subgraph() instead when the same part will be queried many times
+    """
+
+    def __init__(self, parent: DirectedGraph, vertices=None, min_weight=None, max_weight=None):
+        """
+        Creates the view
+        Use DirectedGraph.subgraph() rather than calling this directly
+        :param parent: DirectedGraph to view
+        :param vertices: (optional) iterable of ints to keep. If not provided, all vertices are kept
+        :param min_weight: (optional) number; if given, lighter edges are hidden
+        :param max_weight: (optional) number; if given, heavier edges are hidden
+        """
+        self._parent = parent
+        self._vertices = None if vertices is None else frozenset(vertices)
+        self._min_weight = min_weight
+        self._max_weight = max_weight
+        self._matrix = _FilteredMatrix(self)
+
+    @property
+    def v_count(self) -> int:
+        return self._parent.v_count
+
+    @property
+    def adj_matrix(self) -> '_FilteredMatrix':
+        return self._matrix
+
+    @property
+    def version(self) -> int:
+        return self._parent.version
+
+    def keeps_vertex(self, vertex: int) -> bool:
+        """
+        Checks whether a vertex of the parent graph is visible in the view
+        :param vertex: int identifying a valid vertex of the parent graph
+        :return: True if the vertex is kept; False otherwise
+        """
+        return self._vertices is None or vertex in self._vertices
+
+    def weight(self, src: int, dst: int):
+        """
+        Returns the weight of an edge as seen through the view
+        :param src: int identifying a valid vertex of the parent graph
+        :param dst: int identifying a valid vertex of the parent graph
+        :return: the edge's weight, or 0 if there is no such edge or it is hidden
+        """
+        weight = self._parent.adj_matrix[src][dst]
+        if weight == 0 or not self.keeps_vertex(src) or not self.keeps_vertex(dst):
+            return 0
+        if self._min_weight is not None and weight < self._min_weight:
+            return 0
+        if self._max_weight is not None and weight > self._max_weight:
+            return 0
+
+        return weight
+
+    def vertices_are_valid(self, src: int, dst: int = None) -> bool:
+        """
+        Validates two vertices, which must be in the parent graph and kept by the view
+        :param src: int identifying a vertex
+        :param dst: int identifying a different vertex
+        :return: True if the vertices are valid; False otherwise
+        """
+        if not self._parent.vertices_are_valid(src, dst):
+            return False
+
+        return self.keeps_vertex(src) and (dst is None or self.keeps_vertex(dst))
+
+    def get_vertices(self) -> list:
+        """
+        Returns a list of the vertices kept by the view, least to greatest
+        :return: list of int vertices
+        """
+        if self._vertices is None:
+            return self._parent.get_vertices()
+        return sorted(vertex for vertex in self._vertices if self._parent.vertices_are_valid(vertex))
+
+    def get_children(self, vertex: int) -> list:
+        """
+        Returns a vertex's children, as seen through the view
+        :param vertex: int vertex whose children will be returned
+        :return: list of ints identifying the given vertex's visible child vertices
+        """
+        return [child for child in self._parent.get_children(vertex) if self.weight(vertex, child) > 0]
+
+    def get_parents(self, vertex: int) -> list:
+        """
+        Returns a vertex's parents, as seen through the view
+        :param vertex: int vertex whose parents will be returned
+        :return: list of ints identifying the visible vertices with a visible edge to the given vertex
+        """
+        return [parent for parent in self._parent.get_parents(vertex) if self.weight(parent, vertex) > 0]
+
+    def dijkstra(self, src: int) -> []:
+        """
+        Computes the length of the shortest path from a given vertex to all other vertices, as seen through the view
+        :param src: int identifying the source vertex from which to measure paths
+        :return: list with one value per vertex in the parent graph, infinity where a vertex is unreachable or hidden
+        """
+        distances = [float('inf')] * self.v_count
+        if not self.vertices_are_valid(src):
+            return distances
+
+        # the inherited search reports one distance per visible vertex, in order
+        for vertex, distance in zip(self.get_vertices(), super().dijkstra(src)):
+            distances[vertex] = distance
+
+        return distances
+
+    def add_vertex(self) -> int:
+        raise TypeError('subgraph views are read-only; change the parent graph instead')
+
+    def add_edge(self, src: int, dst: int, weight=1) -> None:
+        raise TypeError('subgraph views are read-only; change the parent graph instead')
+
+    def remove_edge(self, src: int, dst: int) -> None:
+        raise TypeError('subgraph views are read-only; change the parent graph instead')
+
+
+class _FilteredMatrix:
+    """
+    Class to implement the adj_matrix of a DirectedSubgraphView, hiding filtered edges as weight 0
+    """
+
+    def __init__(self, view: DirectedSubgraphView):
+        self._view = view
+
+    def __len__(self):
+        return self._view.v_count
+
+    def __getitem__(self, src: int) -> '_FilteredRow':
+        return _FilteredRow(self._view, src)
+
+    def __iter__(self):
+        for src in range(len(self)):
+            yield self[src]
+
+
+class _FilteredRow:
+    """
+    Class to implement one row of a _FilteredMatrix
+    """
+
+    def __init__(self, view: DirectedSubgraphView, src: int):
+        self._view = view
+        self._src = src
+
+    def __len__(self):
+        return self._view.v_count
+
+    def __getitem__(self, dst: int):
+        return self._view.weight(self._src, dst)
+
+    def __iter__(self):
+        for dst in range(len(self)):
+            yield self[dst]
+
+
+def _bounded_search(successors, is_valid, sources, max_distance, max_settled, targets) -> dict:
+    """
+    Runs a multi-source Dijkstra search that can stop early
+    Shared by DirectedGraph.bounded_dijkstra() and FrozenDirectedGraph.bounded_dijkstra()
+    :param successors: function taking a vertex and returning its (successor, weight) pairs
+    :param is_valid: function taking a vertex and returning True if it is in the graph
+    :param sources: int or iterable of ints identifying the source vertices; invalid sources are ignored
+    :param max_distance: number or None; see bounded_dijkstra()
+    :param max_settled: int or None; see bounded_dijkstra()
+    :param targets: set of ints or None; see bounded_dijkstra()
+    :return: dict of {vertex: distance}, nearest first
+    """
+    if isinstance(sources, int):
+        sources = [sources]
+    if targets is not None:
+        targets = set(target for target in targets if is_valid(target))
+
+    found = {}
+    if max_settled is not None and max_settled <= 0:
+        return found
+
+    settled = set()
+    to_visit = [(0, source) for source in set(sources) if is_valid(source)]
+    heapify(to_visit)
+    targets_left = len(targets) if targets is not None else None
+
+    while len(to_visit) > 0 and targets_left != 0:
+        distance, vertex = heappop(to_visit)
+        if vertex in settled:
+            continue
+
+        # everything still queued is at least this far away
+        if max_distance is not None and distance > max_distance:
+            break
+
+        settled.add(vertex)
+        if targets is None or vertex in targets:
+            found[vertex] = distance
+            if targets_left is not None:
+                targets_left -= 1
+            if max_settled is not None and len(found) >= max_settled:
+                break
+
+        for successor, weight in successors(vertex):
+            if successor not in settled:
+                heappush(to_visit, (distance + weight, successor))
+
+    return found
+
+
+class ShortestPathCache:
+    """
+    Class to implement a least-recently-used cache of DirectedGraph.dijkstra() results, keyed by source
+    - each entry is stamped with the graph version it is valid for
+    - on each graph change, entries the change cannot affect are kept and restamped; the rest are dropped
+    - entries whose stamp doesn't match the graph's version are never returned
+    - every method holds the cache's own lock, so concurrent dijkstra() readers can share it
+    """
+
+    def __init__(self, graph: DirectedGraph, max_entries: int = 128, max_bytes: int = None):
+        """
+        Initializes an empty cache
+        Use DirectedGraph.enable_dijkstra_cache() rather than calling this directly
+        :param graph: DirectedGraph whose results are cached
+        :param max_entries: (optional) int limit on the number of sources remembered
+        :param max_bytes: (optional) int limit on the approximate memory used by remembered results
+        """
+        self._graph = graph
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # {src: [version, distances, size_in_bytes]}, least recently used first
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _size_of(distances: list) -> int:
+        """
+        Estimates the memory held by a list of distances
+        :param distances: list of numbers
+        :return: int approximate size in bytes
+        """
+        return sys.getsizeof(distances) + sum(sys.getsizeof(distance) for distance in distances)
+
+    def get(self, src: int):
+        """
+        Looks up the distances from a source
+        :param src: int identifying the source vertex
+        :return: a fresh copy of the cached list of distances, or None if there is no valid entry
+        """
+        with self._lock:
+            entry = self._entries.get(src)
+            if entry is None or entry[0] != self._graph.version:
+                if entry is not None:
+                    self._drop(src)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(src)
+            self.hits += 1
+            return list(entry[1])
+
+    def put(self, src: int, distances: list, version: int = None) -> None:
+        """
+        Remembers the distances from a source, evicting the least recently used entries to stay within limits
+        :param src: int identifying the source vertex
+        :param distances: list of distances
+        :param version: (optional) int graph version the distances were computed for. If not provided,
+                        the graph's current version. Distances for an older version are not stored
+        """
+        size = self._size_of(distances)
+
+        with self._lock:
+            if version is None:
+                version = self._graph.version
+            elif version != self._graph.version:
+                # the graph changed while the distances were being computed
+                return
+
+            if src in self._entries:
+                self._drop(src)
+
+            if self.max_bytes is not None and size > self.max_bytes:
+                # too big to ever fit
+                return
+
+            self._entries[src] = [version, list(distances), size]
+            self._bytes += size
+
+            while (len(self._entries) > self.max_entries
+                   or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """
+        Forgets every entry
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, src: int) -> None:
+        """
+        Forgets one entry, if it is still there
+        The caller must hold the lock
+        :param src: int identifying a cached source vertex
+        """
+        entry = self._entries.pop(src, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def vertex_added(self) -> None:
+        """
+        Extends every entry with the new vertex, which nothing can reach yet
+        """
+        with self._lock:
+            version = self._graph.version
+            for entry in self._entries.values():
+                entry[1].append(float('inf'))
+                size = self._size_of(entry[1])
+                self._bytes += size - entry[2]
+                entry[0], entry[2] = version, size
+
+    def edge_changed(self, src: int, dst: int, old_weight, new_weight) -> None:
+        """
+        Drops entries the change could affect and restamps the rest
+        A shorter or new edge matters only if it beats the cached distance to dst
+        A longer or removed edge matters only if it was tight, i.e. on some shortest path to dst
+        :param src: int identifying the edge's source vertex
+        :param dst: int identifying the edge's destination vertex
+        :param old_weight: weight before the change, or 0 if there was no edge
+        :param new_weight: weight after the change, or 0 if the edge was removed
+        """
+        with self._lock:
+            version = self._graph.version
+            stale = []
+            for source, entry in self._entries.items():
+                distances = entry[1]
+                if new_weight > 0 and (old_weight == 0 or new_weight < old_weight):
+                    affected = distances[src] + new_weight < distances[dst]
+                else:
+                    affected = distances[src] != float('inf') and distances[src] + old_weight == distances[dst]
+
+                if affected:
+                    stale.append(source)
+                else:
+                    entry[0] = version
+
+            for source in stale:
+                self._drop(source)
+
+
+class ShortestPathTree:
+    """
+    Class to implement a shortest-path tree from one source that stays current as its DirectedGraph changes
+    - repairs only the vertices a change affects, in the style of Ramalingam and Reps
+    - a shorter or new edge is relaxed outward from its destination
+    - a longer or removed tree edge resets the subtree below it, which is then rebuilt from its unaffected parents
+    - changes to edges outside the tree that don't shorten any path cost O(1)
+    """
+
+    def __init__(self, graph: DirectedGraph, src: int):
+        """
+        Computes the tree and starts following changes to the graph
+        :param graph: DirectedGraph to measure
+        :param src: int identifying a valid source vertex
+        """
+        if not graph.vertices_are_valid(src):
+            raise ValueError(f'vertex {src} is not in the graph')
+
+        self._graph = graph
+        self.src = src
+        self._distances = [float('inf')] * graph.v_count
+        self._parents = [None] * graph.v_count
+        self._children = [set() for _ in range(graph.v_count)]  # kept in step with _parents
+        self._distances[src] = 0
+        self._relax_from([(0, src)])
+
+        graph.attach_observer(self)
+
+    def detach(self) -> None:
+        """
+        Stops following changes to the graph; the tree is frozen as of this call
+        """
+        self._graph.detach_observer(self)
+
+    def distances(self) -> list:
+        """
+        Returns the length of the shortest path from the source to each vertex, like DirectedGraph.dijkstra()
+        :return: list with one value per vertex, infinity where a vertex is unreachable
+        """
+        return list(self._distances)
+
+    def distance(self, vertex: int):
+        """
+        Returns the length of the shortest path from the source to one vertex
+        :param vertex: int identifying a valid vertex
+        :return: length of the path, or infinity if the vertex is unreachable
+        """
+        return self._distances[vertex]
+
+    def path_to(self, vertex: int) -> list:
+        """
+        Returns a shortest path from the source to one vertex
+        :param vertex: int identifying a valid vertex
+        :return: list of ints from the source to the vertex, or an empty list if the vertex is unreachable
+        """
+        if self._distances[vertex] == float('inf'):
+            return []
+
+        path = [vertex]
+        while path[-1] != self.src:
+            path.append(self._parents[path[-1]])
+        path.reverse()
+
+        return path
+
+    def _set_parent(self, vertex: int, parent) -> None:
+        """
+        Moves a vertex under a new parent in the tree
+        :param vertex: int identifying the vertex to move
+        :param parent: int identifying its new parent, or None to take it out of the tree
+        """
+        if self._parents[vertex] is not None:
+            self._children[self._parents[vertex]].discard(vertex)
+        if parent is not None:
+            self._children[parent].add(vertex)
+        self._parents[vertex] = parent
+
+    def _relax_from(self, to_visit: list, allowed: set = None) -> None:
+        """
+        Runs Dijkstra's algorithm from vertices whose distances were just lowered
+        :param to_visit: list of (distance, vertex) tuples to start from
+        :param allowed: (optional) set limiting which vertices may be updated. If None, any vertex may be
+        """
+        heapify(to_visit)
+        matrix = self._graph.adj_matrix
+
+        while len(to_visit) > 0:
+            distance, vertex = heappop(to_visit)
+            if distance > self._distances[vertex]:
+                # outdated entry; the vertex was reached more cheaply since
+                continue
+
+            for successor in self._graph.get_children(vertex):
+                if allowed is not None and successor not in allowed:
+                    continue
+
+                total_distance = distance + matrix[vertex][successor]
+                if total_distance < self._distances[successor]:
+                    self._distances[successor] = total_distance
+                    self._set_parent(successor, vertex)
+                    heappush(to_visit, (total_distance, successor))
+
+    def vertex_added(self) -> None:
+        """
+        Adds the new vertex, which nothing can reach yet
+        """
+        self._distances.append(float('inf'))
+        self._parents.append(None)
+        self._children.append(set())
+
+    def edge_changed(self, src: int, dst: int, old_weight, new_weight) -> None:
+        """
+        Repairs the tree after an edge is added, removed, or reweighted
+        :param src: int identifying the edge's source vertex
+        :param dst: int identifying the edge's destination vertex
+        :param old_weight: weight before the change, or 0 if there was no edge
+        :param new_weight: weight after the change, or 0 if the edge was removed
+        """
+        if new_weight > 0 and (old_weight == 0 or new_weight < old_weight):
+            # a cheaper edge only matters if it beats the current path to dst
+            total_distance = self._distances[src] + new_weight
+            if total_distance < self._distances[dst]:
+                self._distances[dst] = total_distance
+                self._set_parent(dst, src)
+                self._relax_from([(total_distance, dst)])
+
+        elif self._parents[dst] == src:
+            # a tree edge got longer or disappeared; everything below it may need a new route
+            self._rebuild_subtree(dst)
+
+    def _rebuild_subtree(self, root: int) -> None:
+        """
+        Recomputes distances for a vertex and its descendants in the tree
+        :param root: int identifying the vertex whose tree edge changed
+        """
+        # collect the subtree hanging from root
+        affected = {root}
+        to_check = [root]
+        while len(to_check) > 0:
+            for child in self._children[to_check.pop()]:
+                affected.add(child)
+                to_check.append(child)
+
+        for vertex in affected:
+            self._distances[vertex] = float('inf')
+            self._set_parent(vertex, None)
+
+        # seed each affected vertex with its best edge from outside the subtree
+        matrix = self._graph.adj_matrix
+        to_visit = []
+        for vertex in affected:
+            for parent in self._graph.get_parents(vertex):
+                if parent in affected:
+                    continue
+
+                total_distance = self._distances[parent] + matrix[parent][vertex]
+                if total_distance < self._distances[vertex]:
+                    self._distances[vertex] = total_distance
+                    self._set_parent(vertex, parent)
+
+            if self._distances[vertex] != float('inf'):
+                to_visit.append((self._distances[vertex], vertex))
+
+        # settle the subtree; vertices outside it cannot get shorter
+        self._relax_from(to_visit, affected)
+
+
+class FrozenDirectedGraph:
+    """
+    Class to implement an immutable snapshot of a DirectedGraph
+    - edges are stored as compressed sparse rows in typed arrays
+    - each vertex's successors are sorted least to greatest
+    - instances never change after creation, so they can be shared between threads without locks
+    - instances are hashable and pickle as a few flat arrays
+    """
+    __slots__ = ('v_count', '_offsets', '_targets', '_weights', '_in_degrees', '_hash')
+
+    def __init__(self, v_count: int, offsets, targets, weights):
+        """
+        Stores a snapshot in compressed sparse row form
+        Use DirectedGraph.freeze() rather than calling this directly
+        :param v_count: int showing the number of vertices
+        :param offsets: sequence of v_count + 1 ints; successors of vertex v are targets[offsets[v]:offsets[v + 1]]
+        :param targets: sequence of int successors, sorted within each vertex's run
+        :param weights: sequence of positive edge weights, parallel to targets
+        """
+        # integer weights stay integers; anything else is stored as a double
+        if not isinstance(weights, array):
+            typecode = 'q' if all(isinstance(weight, int) for weight in weights) else 'd'
+            weights = array(typecode, weights)
+
+        # count incoming edges once, so in-degree queries are O(1)
+        in_degrees = array('q', bytes(8 * v_count))
+        for successor in targets:
+            in_degrees[successor] += 1
+
+        object.__setattr__(self, 'v_count', v_count)
+        object.__setattr__(self, '_offsets', array('q', offsets))
+        object.__setattr__(self, '_targets', array('q', targets))
+        object.__setattr__(self, '_weights', weights)
+        object.__setattr__(self, '_in_degrees', in_degrees)
+        object.__setattr__(self, '_hash', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FrozenDirectedGraph is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('FrozenDirectedGraph is immutable')
+
+    def __reduce__(self):
+        return FrozenDirectedGraph, (self.v_count, self._offsets, self._targets, self._weights)
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenDirectedGraph):
+            return NotImplemented
+        return (self.v_count == other.v_count and self._offsets == other._offsets
+                and self._targets == other._targets and self._weights == other._weights)
+
+    def __hash__(self):
+        # hashing walks every edge, so only do it once
+        if self._hash is None:
+            value = hash((self.v_count, self._offsets.tobytes(), self._targets.tobytes(), tuple(self._weights)))
+            object.__setattr__(self, '_hash', value)
+        return self._hash
+
+    def __str__(self):
+        return f'FROZEN GRAPH ({self.v_count} vertices, {len(self._targets)} edges)'
+
+    def vertices_are_valid(self, src: int, dst: int = None) -> bool:
+        """
+        Validates two vertices
+        :param src: int identifying a vertex
+        :param dst: int identifying a different vertex
+        :return: True if the vertices are valid; False otherwise
+        """
+        if src >= self.v_count or src < 0:
+            return False
+
+        if dst is not None:
+            if dst >= self.v_count or dst < 0 or src == dst:
+                return False
+
+        return True
+
+    def get_vertices(self) -> list:
+        """
+        Returns a list of vertices in the graph, least to greatest
+        :return: list of int vertices in the graph
+        """
+        return list(range(self.v_count))
+
+    def get_edges(self) -> list:
+        """
+        Returns a list of edges in the graph as (source, destination, weight) tuples
+        :return: list of edges, ordered by source, then destination
+        """
+        edges = []
+        for vertex in range(self.v_count):
+            for index in range(self._offsets[vertex], self._offsets[vertex + 1]):
+                edges.append((vertex, self._targets[index], self._weights[index]))
+
+        return edges
+
+    def get_children(self, vertex: int) -> list:
+        """
+        Returns a vertex's children
+        :param vertex: int vertex whose children will be returned
+        :return: list of ints identifying the given vertex's child vertices, least to greatest
+        """
+        return self._targets[self._offsets[vertex]:self._offsets[vertex + 1]].tolist()
+
+    def out_degree(self, vertex: int) -> int:
+        """
+        Returns the number of edges leaving a vertex
+        :param vertex: int identifying a valid vertex
+        :return: int count of the vertex's outgoing edges
+        """
+        return self._offsets[vertex + 1] - self._offsets[vertex]
+
+    def in_degree(self, vertex: int) -> int:
+        """
+        Returns the number of edges entering a vertex
+        :param vertex: int identifying a valid vertex
+        :return: int count of the vertex's incoming edges
+        """
+        return self._in_degrees[vertex]
+
+    def edge_weight(self, src: int, dst: int):
+        """
+        Returns the weight of the edge from src to dst
+        :param src: int identifying a valid vertex
+        :param dst: int identifying a valid vertex
+        :return: the edge's weight, or 0 if there is no such edge
+        """
+        # successors are sorted, so a binary search finds the edge
+        start, end = self._offsets[src], self._offsets[src + 1]
+        index = bisect_left(self._targets, dst, start, end)
+        if index < end and self._targets[index] == dst:
+            return self._weights[index]
+
+        return 0
+
+    def is_valid_path(self, path: []) -> bool:
+        """
+        Checks whether a given path is valid in the graph
+        Empty paths are considered valid
+        :param path: list of ints identifying vertices in the path
+        :return: True if the path is valid; False otherwise
+        """
+        for index in range(len(path) - 1):  # -1 because loop reaches forward
+            vertex = path[index]
+            next_vertex = path[index + 1]
+
+            if not self.vertices_are_valid(vertex, next_vertex):
+                return False
+
+            if self.edge_weight(vertex, next_vertex) == 0:
+                return False
+
+        return True
+
+    def dfs(self, v_start: int, v_end: int = None) -> []:
+        """
+        Return list of vertices visited during DFS search, in visitation order
+        Vertices are picked least to greatest
+        If the starting vertex is not in the graph, returns an empty list
+        :param v_start: int identifying the starting vertex
+        :param v_end: (optional) int identifying the vertex after which to end the search early
+        :return: list of ints identifying the visited vertices, or empty list if v_start isn't in the graph
+        """
+        if not self.vertices_are_valid(v_start):
+            return []
+
+        visited = []
+        seen = set()
+        to_visit = Stack([v_start])
+
+        while not to_visit.is_empty():
+            vertex = to_visit.pop()
+            if vertex in seen:
+                continue
+
+            seen.add(vertex)
+            visited.append(vertex)
+            if vertex == v_end:
+                break
+
+            # push greatest first, so the least successor is popped next
+            for index in range(self._offsets[vertex + 1] - 1, self._offsets[vertex] - 1, -1):
+                successor = self._targets[index]
+                if successor not in seen:
+                    to_visit.push(successor)
+
+        return visited
+
+    def bfs(self, v_start: int, v_end: int = None) -> []:
+        """
+        Returns a list of vertices visited during BFS search, in visitation order
+        Vertices are picked least to greatest
+        If the starting vertex is not in the graph, returns an empty list
+        :param v_start: int identifying the starting vertex
+        :param v_end: (optional) int identifying the vertex after which to end the search early
+        :return: list of ints identifying the visited vertices, or empty list if v_start isn't in the graph
+        """
+        if not self.vertices_are_valid(v_start):
+            return []
+
+        visited = []
+        seen = {v_start}
+        to_visit = deque([v_start])
+
+        while len(to_visit) != 0:
+            vertex = to_visit.popleft()
+            visited.append(vertex)
+            if vertex == v_end:
+                break
+
+            for index in range(self._offsets[vertex], self._offsets[vertex + 1]):
+                successor = self._targets[index]
+                if successor not in seen:
+                    seen.add(successor)
+                    to_visit.append(successor)
+
+        return visited
+
+    def has_cycle(self) -> bool:
+        """
+        Detects whether the graph contains a cycle
+        Uses the precomputed in-degrees to peel off vertices with no remaining incoming edges (Kahn's algorithm)
+        :return: True if the graph contains a cycle; False otherwise
+        """
+        remaining = array('q', self._in_degrees)
+        ready = [vertex for vertex in range(self.v_count) if remaining[vertex] == 0]
+        peeled = 0
+
+        while len(ready) > 0:
+            vertex = ready.pop()
+            peeled += 1
+            for index in range(self._offsets[vertex], self._offsets[vertex + 1]):
+                successor = self._targets[index]
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    ready.append(successor)
+
+        # any vertex that could not be peeled sits on, or behind, a cycle
+        return peeled < self.v_count
+
+    def dijkstra(self, src: int) -> []:
+        """
+        Computes the length of the shortest path from a given vertex to all other vertices in the graph
+        If a certain vertex is not reachable from src, its path's value is infinity
+        :param src: int identifying the source vertex from which to measure paths
+        :return: list with one value per vertex in the graph, where the value at index i is the
+            length of the shortest path from vertex SRC to vertex i
+        """
+        distances = [float('inf')] * self.v_count
+        if not self.vertices_are_valid(src):
+            return distances
+
+        settled = [False] * self.v_count
+        to_visit = [(0, src)]
+
+        while len(to_visit) > 0:
+            distance, vertex = heappop(to_visit)
+            if settled[vertex]:
+                continue
+
+            settled[vertex] = True
+            distances[vertex] = distance
+
+            for index in range(self._offsets[vertex], self._offsets[vertex + 1]):
+                successor = self._targets[index]
+                if not settled[successor]:
+                    heappush(to_visit, (distance + self._weights[index], successor))
+
+        return distances
+
+    def bounded_dijkstra(self, sources, max_distance=None, max_settled: int = None, targets=None) -> dict:
+        """
+        Computes shortest path lengths from the nearest of several sources, stopping as early as allowed
+        Same as DirectedGraph.bounded_dijkstra(), but only touches the edges of vertices it settles
+        :param sources: int identifying one source vertex, or iterable of ints identifying several
+        :param max_distance: (optional) number; vertices farther than this are not reported
+        :param max_settled: (optional) int limit on the number of vertices (or targets, if given) reported
+        :param targets: (optional) set of ints; if given, only these vertices are reported
+        :return: dict of {vertex: distance from the nearest source}, nearest first, without unreachable vertices
+        """
+        def successors(vertex):
+            start, end = self._offsets[vertex], self._offsets[vertex + 1]
+            return zip(self._targets[start:end], self._weights[start:end])
+
+        return _bounded_search(successors, self.vertices_are_valid, sources, max_distance, max_settled, targets)
+
+
+if __name__ == '__main__':
+
+    # print("\nPDF - method add_vertex() / add_edge example 1")
+    # print("----------------------------------------------")
+    # g = DirectedGraph()
+    # print(g)
+    # for _ in range(5):
+    #     g.add_vertex()
+    # print(g)
+    #
+    # edges = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3),
+    #          (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+    # for src, dst, weight in edges:
+    #     g.add_edge(src, dst, weight)
+    # print(g)
+
+    # edges = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3),
+    #          (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+    # g = DirectedGraph(edges)
+    # print(g)
+    # for edge in edges:
+    #     src, dst, weight = edge
+    #     g.remove_edge(src, dst)
+    #     print('after removing', src, '->', dst, '\n', g)
+
+    # g = DirectedGraph()
+    # print(g)
+    # for vertex in range(10):
+    #     g.add_vertex()
+    #     print('after adding', vertex, '\n', g)
+    #     print('vertices are')
+    #     g.get_vertices()
+
+    # print("\nPDF - method get_edges() example 1")
+    # print("----------------------------------")
+    # g = DirectedGraph()
+    # print(g.get_edges(), g.get_vertices(), sep='\n')
+    # edges = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3),
+    #          (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+    # g = DirectedGraph(edges)
+    # print(g.get_edges(), g.get_vertices(), sep='\n')
+    #
+    #
+    # print("\nPDF - method is_valid_path() example 1")
+    # print("--------------------------------------")
+    # edges = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3),
+    #          (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+    # g = DirectedGraph(edges)
+    # test_cases = [[0, 1, 4, 3], [1, 3, 2, 1], [0, 4], [4, 0], [], [2]]
+    # for path in test_cases:
+    #     print(path, g.is_valid_path(path))
+    #
+    #
+    # print("\nPDF - method dfs() and bfs() example 1")
+    # print("--------------------------------------")
+    # edges = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3),
+    #          (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+    # g = DirectedGraph(edges)
+    # for start in range(5):
+    #     print(f'{start} DFS:{g.dfs(start)} BFS:{g.bfs(start)}')
+    #
+    #
+    print("\nPDF - method has_cycle() example 1")
+    print("----------------------------------")
+    edges = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3),
+             (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+    g = DirectedGraph(edges)
+
+    edges_to_remove = [(3, 1), (4, 0), (3, 2)]
+    for src, dst in edges_to_remove:
+        g.remove_edge(src, dst)
+        print(g.get_edges(), g.has_cycle(), sep='\n')
+
+    edges_to_add = [(4, 3), (2, 3), (1, 3), (4, 0)]
+    for src, dst in edges_to_add:
+        g.add_edge(src, dst)
+        print(g.get_edges(), g.has_cycle(), sep='\n')
+    print('\n', g)
+    #
+    #
+    # print("\nPDF - dijkstra() example 1")
+    # print("--------------------------")
+    # edges = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3),
+    #          (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+    # g = DirectedGraph(edges)
+    # for i in range(5):
+    #     print(f'DIJKSTRA {i} {g.dijkstra(i)}')
+    # g.remove_edge(4, 3)
+    # print('\n', g)
+    # for i in range(5):
+    #     print(f'DIJKSTRA {i} {g.dijkstra(i)}')
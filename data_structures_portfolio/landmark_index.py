@@ -0,0 +1,322 @@
+# Course: CS261 - Data Structures
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Implements a landmark (ALT) index for fast distance bounds and A* point queries on a directed graph
+
+
+from array import array
+from collections import deque
+from hashlib import blake2b
+from heapq import heappush, heappop
+import struct
+import sys
+
+
+class LandmarkIndex:
+    """
+    Class to implement a landmark distance index for a DirectedGraph
+    - stores, for each of k landmarks, the distance from it to every vertex and from every vertex to it
+    - the triangle inequality turns those distances into lower and upper bounds on any distance in O(k)
+    - the lower bounds also guide an A* search that answers exact queries while settling few vertices
+    - only valid for the graph version it was built for; rebuild after the graph changes
+    """
+    _MAGIC = b'ALT2'
+    _HEADER = struct.Struct('<4sqqQ')  # magic, landmark count, vertex count, graph fingerprint
+
+    def __init__(self, graph, landmarks: list, forward, backward):
+        """
+        Stores a built index
+        Use LandmarkIndex.build() or LandmarkIndex.load() rather than calling this directly
+        :param graph: DirectedGraph the index describes
+        :param landmarks: list of int landmark vertices
+        :param forward: array of doubles; forward[i * v_count + x] is the distance from landmark i to x
+        :param backward: array of doubles; backward[i * v_count + x] is the distance from x to landmark i
+        """
+        self._graph = graph
+        self.landmarks = list(landmarks)
+        self.v_count = graph.v_count
+        self.version = graph.version
+        self._forward = forward
+        self._backward = backward
+
+    @classmethod
+    def build(cls, graph, k: int = 8) -> 'LandmarkIndex':
+        """
+        Picks landmarks and measures their distances
+        Each new landmark is the vertex worst covered by the landmarks so far: first the vertices cut off
+            from every landmark in both directions, then those cut off in one direction, and among those
+            the one farthest from its nearest landmark in the directions that do connect
+        Ties, which are common in one-way graphs, go to the vertex the most edges away from every landmark,
+            ignoring edge direction, so the landmarks spread out instead of piling up in one corner
+        :param graph: DirectedGraph to index
+        :param k: (optional) int count of landmarks. Fewer are used if the graph is smaller
+        :return: new LandmarkIndex
+        """
+        v_count = graph.v_count
+        landmarks = []
+        forward = array('d')
+        backward = array('d')
+
+        # how well each vertex is covered, in each direction: its distance from, and to, the nearest landmark
+        # directions are scored separately, since most vertices of a one-way graph have no round trip at all
+        inf = float('inf')
+        nearest_from = [inf] * v_count
+        nearest_to = [inf] * v_count
+        nearest_hops = [inf] * v_count
+
+        def coverage(vertex):
+            # an unconnected direction outranks any finite distance
+            distances = (nearest_from[vertex], nearest_to[vertex])
+            finite = [distance for distance in distances if distance != inf]
+            return len(distances) - len(finite), min(finite, default=0), nearest_hops[vertex]
+
+        candidate = 0
+        while len(landmarks) < min(k, v_count):
+            landmarks.append(candidate)
+            to_landmark = _reverse_distances(graph, candidate)
+            from_landmark = graph.dijkstra(candidate)
+            forward.extend(from_landmark)
+            backward.extend(to_landmark)
+
+            hops = _hop_distances(graph, candidate)
+            for vertex in range(v_count):
+                nearest_from[vertex] = min(nearest_from[vertex], from_landmark[vertex])
+                nearest_to[vertex] = min(nearest_to[vertex], to_landmark[vertex])
+                nearest_hops[vertex] = min(nearest_hops[vertex], hops[vertex])
+
+            chosen = set(landmarks)
+            remaining = [vertex for vertex in range(v_count) if vertex not in chosen]
+            if len(remaining) > 0:
+                candidate = max(remaining, key=coverage)
+
+        return cls(graph, landmarks, forward, backward)
+
+    def is_current(self) -> bool:
+        """
+        Checks whether the graph has changed since the index was built
+        :return: True if the index still describes the graph; False otherwise
+        """
+        return self._graph.version == self.version and self._graph.v_count == self.v_count
+
+    def _check_current(self) -> None:
+        """
+        Raises ValueError if the index no longer describes the graph
+        """
+        if not self.is_current():
+            raise ValueError('the graph changed after the landmark index was built; rebuild it')
+
+    def _check_vertices(self, src: int, dst: int) -> None:
+        """
+        Raises ValueError unless both vertices are in the graph
+        A negative number would otherwise read another landmark's row, and an empty graph has no rows at all
+        :param src: int identifying a vertex
+        :param dst: int identifying a vertex
+        """
+        for vertex in (src, dst):
+            if not self._graph.vertices_are_valid(vertex):
+                raise ValueError(f'vertex {vertex} is not in the graph')
+
+    def _lower_bound(self, src: int, dst: int):
+        """
+        Returns the best triangle-inequality lower bound on the distance from src to dst
+        Helper for distance_bounds() and distance()
+        :param src: int identifying a valid vertex
+        :param dst: int identifying a valid vertex
+        :return: lower bound, which is infinity when dst provably can't be reached from src
+        """
+        inf = float('inf')
+        v_count = self.v_count
+        bound = 0
+
+        for offset in range(0, len(self._forward), v_count):
+            # d(src, dst) >= d(landmark, dst) - d(landmark, src)
+            from_src, from_dst = self._forward[offset + src], self._forward[offset + dst]
+            if from_src != inf:
+                bound = max(bound, from_dst - from_src)
+
+            # d(src, dst) >= d(src, landmark) - d(dst, landmark)
+            to_src, to_dst = self._backward[offset + src], self._backward[offset + dst]
+            if to_dst != inf:
+                bound = max(bound, to_src - to_dst)
+
+        return bound
+
+    def distance_bounds(self, src: int, dst: int) -> tuple:
+        """
+        Bounds the length of the shortest path from src to dst in O(k), without searching the graph
+        :param src: int identifying a valid vertex
+        :param dst: int identifying a valid vertex
+        :return: tuple of (lower bound, upper bound); either may be infinity
+        """
+        self._check_current()
+        self._check_vertices(src, dst)
+        if src == dst:
+            return 0, 0
+
+        # going through a landmark is a real path, so it bounds the distance from above
+        upper = float('inf')
+        v_count = self.v_count
+        for offset in range(0, len(self._forward), v_count):
+            upper = min(upper, self._backward[offset + src] + self._forward[offset + dst])
+
+        return self._lower_bound(src, dst), upper
+
+    def distance(self, src: int, dst: int):
+        """
+        Computes the exact length of the shortest path from src to dst with an A* search
+        The landmark lower bounds steer the search toward dst, so it usually settles far fewer vertices than dijkstra()
+        :param src: int identifying a valid vertex
+        :param dst: int identifying a valid vertex
+        :return: length of the shortest path, or infinity if dst can't be reached
+        """
+        self._check_current()
+        self._check_vertices(src, dst)
+        if self._lower_bound(src, dst) == float('inf'):
+            return float('inf')
+
+        matrix = self._graph.adj_matrix
+        best = {src: 0}
+        settled = set()
+        to_visit = [(self._lower_bound(src, dst), 0, src)]  # (estimated total, distance so far, vertex)
+
+        while len(to_visit) > 0:
+            _, distance, vertex = heappop(to_visit)
+            if vertex == dst:
+                return distance
+            if vertex in settled:
+                continue
+            settled.add(vertex)
+
+            for successor in self._graph.get_children(vertex):
+                total_distance = distance + matrix[vertex][successor]
+                if successor not in settled and total_distance < best.get(successor, float('inf')):
+                    best[successor] = total_distance
+                    heappush(to_visit, (total_distance + self._lower_bound(successor, dst),
+                                        total_distance, successor))
+
+        return float('inf')
+
+    def save(self, path: str) -> None:
+        """
+        Writes the index to a file, so it can be stored next to the graph
+        Everything is written little-endian, so the file can be read on any machine
+        :param path: string naming the file to write
+        """
+        with open(path, 'wb') as file:
+            file.write(self._HEADER.pack(self._MAGIC, len(self.landmarks), self.v_count,
+                                         _fingerprint(self._graph)))
+            _write_little_endian(file, array('q', self.landmarks))
+            _write_little_endian(file, self._forward)
+            _write_little_endian(file, self._backward)
+
+    @classmethod
+    def load(cls, path: str, graph) -> 'LandmarkIndex':
+        """
+        Reads an index written by save()
+        The file must have been written for a graph with the same vertices and edges
+        :param path: string naming the file to read
+        :param graph: DirectedGraph the index was built from
+        :return: LandmarkIndex for the graph
+        """
+        with open(path, 'rb') as file:
+            magic, k, v_count, fingerprint = cls._HEADER.unpack(file.read(cls._HEADER.size))
+            if magic != cls._MAGIC:
+                raise ValueError(f'{path} is not a landmark index')
+            if v_count != graph.v_count:
+                raise ValueError(f'{path} describes a graph with {v_count} vertices, not {graph.v_count}')
+            if fingerprint != _fingerprint(graph):
+                raise ValueError(f'{path} was built from a graph with different edges')
+
+            landmarks = _read_little_endian(file, 'q', k)
+            forward = _read_little_endian(file, 'd', k * v_count)
+            backward = _read_little_endian(file, 'd', k * v_count)
+
+        return cls(graph, landmarks.tolist(), forward, backward)
+
+
+def _fingerprint(graph) -> int:
+    """
+    Computes a checksum of a graph's edges that is the same in every process and on every machine
+    hash() can't be used, because it is salted differently in each process
+    :param graph: DirectedGraph to summarize
+    :return: int from 0 to 2 ** 64 - 1
+    """
+    edge = struct.Struct('<qqd')
+    digest = blake2b(struct.pack('<q', graph.v_count), digest_size=8)
+    for src, dst, weight in sorted(graph.get_edges()):
+        digest.update(edge.pack(src, dst, weight))
+
+    return int.from_bytes(digest.digest(), 'little')
+
+
+def _write_little_endian(file, values: array) -> None:
+    """
+    Writes an array to a binary file in little-endian byte order
+    :param file: binary file open for writing
+    :param values: array to write; it is not changed
+    """
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(file)
+
+
+def _read_little_endian(file, typecode: str, count: int) -> array:
+    """
+    Reads an array written by _write_little_endian()
+    :param file: binary file open for reading
+    :param typecode: string array typecode of the values
+    :param count: int count of values to read
+    :return: array of the values, in this machine's byte order
+    """
+    values = array(typecode)
+    values.fromfile(file, count)
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values
+
+
+def _reverse_distances(graph, dst: int) -> list:
+    """
+    Computes the length of the shortest path from every vertex to one vertex, by searching edges backward
+    :param graph: DirectedGraph to measure
+    :param dst: int identifying the destination vertex
+    :return: list with one value per vertex, infinity where dst can't be reached from the vertex
+    """
+    distances = [float('inf')] * graph.v_count
+    matrix = graph.adj_matrix
+    to_visit = [(0, dst)]
+
+    while len(to_visit) > 0:
+        distance, vertex = heappop(to_visit)
+        if distances[vertex] != float('inf'):
+            continue
+        distances[vertex] = distance
+
+        for parent in graph.get_parents(vertex):
+            if distances[parent] == float('inf'):
+                heappush(to_visit, (distance + matrix[parent][vertex], parent))
+
+    return distances
+
+
+def _hop_distances(graph, src: int) -> list:
+    """
+    Counts the fewest edges between one vertex and every vertex, following edges in either direction
+    :param graph: DirectedGraph to measure
+    :param src: int identifying the vertex to count from
+    :return: list with one int per vertex, infinity where the vertex is not connected to src at all
+    """
+    hops = [float('inf')] * graph.v_count
+    hops[src] = 0
+    to_visit = deque([src])
+
+    while len(to_visit) > 0:
+        vertex = to_visit.popleft()
+        for neighbor in graph.get_children(vertex) + graph.get_parents(vertex):
+            if hops[neighbor] == float('inf'):
+                hops[neighbor] = hops[vertex] + 1
+                to_visit.append(neighbor)
+
+    return hops
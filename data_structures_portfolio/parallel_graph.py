@@ -0,0 +1,272 @@
+# Course: CS261 - Data Structures
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Implements connected-component counting and BFS for undirected graphs using a pool of processes
+
+
+import os
+
+
+# shared storage each worker process attaches to once, when it starts
+_worker_memory = []
+_worker_offsets = None
+_worker_targets = None
+_worker_visited = None
+
+
+class _SharedGraph:
+    """
+    Class to implement a copy of a frozen undirected graph in shared memory
+    - holds the offsets and targets arrays, plus one visited flag per vertex
+    - the process that creates it must call close() to free the memory
+    """
+
+    def __init__(self, snapshot):
+        """
+        Copies a snapshot's storage into new shared memory blocks
+        :param snapshot: FrozenUndirectedGraph to share
+        """
+        from multiprocessing import shared_memory
+
+        self.names, offsets, targets = snapshot.csr()
+        self.blocks = []
+        self.offsets = self._share(shared_memory, offsets.tobytes(), 'q')
+        self.targets = self._share(shared_memory, targets.tobytes(), 'q')
+        self.visited = self._share(shared_memory, bytes(len(self.names)), 'B')
+
+    def _share(self, shared_memory, data: bytes, typecode: str) -> memoryview:
+        """
+        Copies bytes into a new shared memory block
+        :param shared_memory: the multiprocessing.shared_memory module
+        :param data: bytes to copy
+        :param typecode: string array typecode of the data
+        :return: memoryview of the block, cast to the typecode
+        """
+        block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        block.buf[:len(data)] = data
+        self.blocks.append(block)
+        return block.buf[:len(data)].cast(typecode)
+
+    def handles(self) -> tuple:
+        """
+        Returns what a worker needs to attach to the shared blocks
+        :return: tuple of (block name, byte length, typecode) tuples
+        """
+        return tuple((block.name, view.nbytes, view.format)
+                     for block, view in zip(self.blocks, (self.offsets, self.targets, self.visited)))
+
+    def close(self) -> None:
+        """
+        Releases and frees the shared memory blocks
+        """
+        for view in (self.offsets, self.targets, self.visited):
+            view.release()
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+
+
+def _attach(handles: tuple) -> None:
+    """
+    Attaches this worker process to the shared graph
+    Process pool initializer
+    :param handles: tuple returned by _SharedGraph.handles()
+    """
+    global _worker_offsets, _worker_targets, _worker_visited
+    from multiprocessing import shared_memory
+
+    views = []
+    for name, length, typecode in handles:
+        block = shared_memory.SharedMemory(name=name)
+        _worker_memory.append(block)
+        views.append(block.buf[:length].cast(typecode))
+
+    _worker_offsets, _worker_targets, _worker_visited = views
+
+
+def _find(parent: dict, vertex: int) -> int:
+    """
+    Finds the root of a vertex's tree in a union-find, halving the path on the way
+    :param parent: dict of int vertex to int parent vertex; vertices not in it are their own root
+    :param vertex: int vertex number
+    :return: int vertex number of the root
+    """
+    parent.setdefault(vertex, vertex)
+    while parent[vertex] != vertex:
+        parent[vertex] = parent[parent[vertex]]
+        vertex = parent[vertex]
+    return vertex
+
+
+def _component_forest(start: int, end: int) -> list:
+    """
+    Finds a spanning forest of the edges leaving one range of vertices
+    Runs in a worker process
+    :param start: int identifying the first vertex in the range
+    :param end: int identifying the vertex after the last one in the range
+    :return: list of (vertex, other_vertex) edges, at most one per vertex touched
+    """
+    parent = {}
+    forest = []
+    for vertex in range(start, end):
+        for index in range(_worker_offsets[vertex], _worker_offsets[vertex + 1]):
+            neighbor = _worker_targets[index]
+
+            # each edge is stored from both ends; only look at it from the lower-numbered one
+            if neighbor <= vertex:
+                continue
+
+            root_1, root_2 = _find(parent, vertex), _find(parent, neighbor)
+            if root_1 != root_2:
+                parent[root_2] = root_1
+                forest.append((vertex, neighbor))
+
+    return forest
+
+
+def _merge_forests(forest_1: list, forest_2: list) -> list:
+    """
+    Combines two spanning forests into one spanning forest of their union
+    Runs in a worker process
+    :param forest_1: list of (vertex, other_vertex) edges
+    :param forest_2: list of (vertex, other_vertex) edges
+    :return: list of (vertex, other_vertex) edges, fewer than the number of vertices touched
+    """
+    parent = {}
+    forest = []
+    for vertex, neighbor in forest_1 + forest_2:
+        root_1, root_2 = _find(parent, vertex), _find(parent, neighbor)
+        if root_1 != root_2:
+            parent[root_2] = root_1
+            forest.append((vertex, neighbor))
+
+    return forest
+
+
+def _expand(frontier: list) -> list:
+    """
+    Lists the unvisited neighbors of a run of frontier vertices, in frontier order
+    Runs in a worker process; the visited flags are only read, never written
+    :param frontier: list of int vertex numbers
+    :return: list of int vertex numbers, possibly with repeats
+    """
+    found = []
+    for vertex in frontier:
+        for index in range(_worker_offsets[vertex], _worker_offsets[vertex + 1]):
+            neighbor = _worker_targets[index]
+            if not _worker_visited[neighbor]:
+                found.append(neighbor)
+
+    return found
+
+
+def _chunks(count: int, pieces: int) -> list:
+    """
+    Splits range(count) into contiguous, nearly equal ranges
+    :param count: int length of the range to split
+    :param pieces: int number of ranges wanted
+    :return: list of (start, end) tuples
+    """
+    pieces = max(1, min(pieces, count))
+    return [(count * piece // pieces, count * (piece + 1) // pieces) for piece in range(pieces)]
+
+
+def _freeze(graph):
+    """
+    Returns a frozen copy of a graph, or the graph itself if it is already frozen
+    :param graph: UndirectedGraph or FrozenUndirectedGraph
+    :return: FrozenUndirectedGraph
+    """
+    from .ud_graph import FrozenUndirectedGraph
+
+    if isinstance(graph, FrozenUndirectedGraph):
+        return graph
+    return graph.freeze()
+
+
+def parallel_connected_components(graph, workers: int = None) -> int:
+    """
+    Counts the connected components of an undirected graph using a pool of processes
+    Each worker builds a spanning forest for one range of vertices; the pool then merges the forests in pairs
+        until one spanning forest of the whole graph is left, and every edge in it joins two components
+    :param graph: UndirectedGraph or FrozenUndirectedGraph
+    :param workers: (optional) int count of worker processes. If not provided, one per CPU
+    :return: int showing the number of connected components in the graph
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count()
+    shared = _SharedGraph(_freeze(graph))
+    v_count = len(shared.names)
+
+    try:
+        with ProcessPoolExecutor(workers, initializer=_attach, initargs=(shared.handles(),)) as pool:
+            # several ranges per worker, so a dense range doesn't leave the others idle
+            ranges = _chunks(v_count, workers * 4)
+            forests = list(pool.map(_component_forest, [start for start, _ in ranges], [end for _, end in ranges]))
+
+            # each round halves the number of forests; an odd one out waits for the next round
+            while len(forests) > 1:
+                carried = [forests.pop()] if len(forests) % 2 == 1 else []
+                forests = list(pool.map(_merge_forests, forests[0::2], forests[1::2])) + carried
+    finally:
+        shared.close()
+
+    return v_count - len(forests[0])
+
+
+def parallel_bfs(graph, v_start, v_end=None, workers: int = None, min_chunk: int = 1024) -> list:
+    """
+    Returns a list of vertices visited during BFS search, in visitation order, using a pool of processes
+    Visits vertices in the same order as a serial BFS: each level is split among the workers,
+        and their results are merged in frontier order
+    :param graph: UndirectedGraph or FrozenUndirectedGraph
+    :param v_start: string identifying the starting vertex
+    :param v_end: (optional) string identifying the vertex after which to end the search early
+    :param workers: (optional) int count of worker processes. If not provided, one per CPU
+    :param min_chunk: (optional) int; levels smaller than this many vertices per worker are expanded in this process
+    :return: list of strings identifying the visited vertices, or empty list if v_start isn't in the graph
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    snapshot = _freeze(graph)
+    if not snapshot.is_in_graph(v_start):
+        return []
+
+    workers = workers or os.cpu_count()
+    shared = _SharedGraph(snapshot)
+    names = shared.names
+    visited_flags = shared.visited
+    start = snapshot.vertex_number(v_start)
+    end = snapshot.vertex_number(v_end)
+    order = [start]
+    visited_flags[start] = 1
+
+    try:
+        with ProcessPoolExecutor(workers, initializer=_attach, initargs=(shared.handles(),)) as pool:
+            frontier = [start]
+            while len(frontier) > 0 and (end is None or not visited_flags[end]):
+                if len(frontier) < workers * min_chunk:
+                    found = [[neighbor for vertex in frontier
+                              for neighbor in shared.targets[shared.offsets[vertex]:shared.offsets[vertex + 1]]
+                              if not visited_flags[neighbor]]]
+                else:
+                    ranges = _chunks(len(frontier), workers)
+                    found = pool.map(_expand, [frontier[first:last] for first, last in ranges])
+
+                # workers only saw the flags from before this level, so drop repeats while merging
+                frontier = []
+                for neighbors in found:
+                    for neighbor in neighbors:
+                        if not visited_flags[neighbor]:
+                            visited_flags[neighbor] = 1
+                            frontier.append(neighbor)
+                order.extend(frontier)
+    finally:
+        shared.close()
+
+    # the level that reached v_end may have gone past it
+    if end is not None and end in order:
+        order = order[:order.index(end) + 1]
+
+    return [names[vertex] for vertex in order]
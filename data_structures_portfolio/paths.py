@@ -0,0 +1,43 @@
+# Course: CS261 - Data Structures
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Implements the batch path format shared by the graphs' validate_paths() methods
+
+
+from collections.abc import Sequence
+
+
+def flatten_paths(paths, offsets=None) -> tuple:
+    """
+    Puts a batch of paths into flat form, where path i is flat[offsets[i]:offsets[i + 1]]
+    :param paths: iterable of paths, or one flat sequence of vertices if offsets is given
+    :param offsets: (optional) list of path count + 1 ints marking where each path starts in paths
+    :return: tuple of (flat list of vertices, list of offsets)
+    """
+    if offsets is None:
+        # one pass, so a generator of paths works too
+        flat = []
+        offsets = [0]
+        for path in paths:
+            flat.extend(path)
+            offsets.append(len(flat))
+        return flat, offsets
+
+    # the checks below need the length and random access
+    if not isinstance(paths, Sequence):
+        paths = list(paths)
+
+    # bad offsets would silently read the wrong vertices, so check them before any path is walked
+    if len(offsets) == 0:
+        raise ValueError('offsets needs at least one entry')
+    if offsets[0] < 0 or offsets[-1] > len(paths):
+        raise ValueError(f'offsets must stay between 0 and {len(paths)}, the length of paths')
+    for index in range(len(offsets) - 1):
+        if offsets[index] > offsets[index + 1]:
+            raise ValueError(f'offsets must not decrease, but offsets[{index}] > offsets[{index + 1}]')
+
+    # a list of paths with offsets is the likeliest mix-up; a vertex is never itself a list
+    if len(paths) > 0 and isinstance(paths[0], (list, tuple)):
+        raise ValueError('with offsets, paths must be one flat list of vertices')
+
+    return paths, offsets
@@ -0,0 +1,266 @@
+# Course: CS261 - Data Structures
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Implements an asyncio query service that coalesces concurrent graph queries from the same source
+
+
+import asyncio
+import json
+
+
+# frozen graph held by each worker process, installed once when the worker starts
+_worker_graph = None
+
+
+def _install_graph(snapshot) -> None:
+    """
+    Stores a frozen graph in this worker process
+    Process pool initializer for GraphQueryService
+    :param snapshot: FrozenDirectedGraph or FrozenUndirectedGraph
+    """
+    global _worker_graph
+    _worker_graph = snapshot
+
+
+def _run_query(method: str, src):
+    """
+    Runs one query against the worker's frozen graph
+    :param method: string naming a query method of the frozen graph, like 'dijkstra' or 'bfs'
+    :param src: vertex the query starts from
+    :return: the query method's result
+    """
+    return getattr(_worker_graph, method)(src)
+
+
+class GraphQueryService:
+    """
+    Class to implement an asyncio front-end for shortest-path, reachability, and traversal queries
+    - queries run against a frozen snapshot of the graph, never the live graph
+    - concurrent queries that need the same (method, source) run share one computation
+    - with workers > 0, computations run in a process pool; otherwise they run in the loop's default thread pool
+    """
+    QUERY_METHODS = frozenset(['dijkstra', 'bfs', 'dfs'])
+
+    def __init__(self, graph, workers: int = 0):
+        """
+        Initializes the service
+        :param graph: DirectedGraph or UndirectedGraph to answer queries about
+        :param workers: (optional) int count of worker processes. If 0, queries run on threads in this process
+        """
+        self._workers = workers
+        self._executor = None
+        self._snapshot = None
+        self._generation = 0
+        self._in_flight = {}  # {(generation, method, src): future shared by every waiting caller}
+        self.reload(graph)
+
+    def reload(self, graph) -> None:
+        """
+        Replaces the snapshot queries run against
+        Queries already running finish against the old snapshot
+        :param graph: DirectedGraph or UndirectedGraph to answer queries about from now on
+        """
+        self._snapshot = graph.freeze()
+        self._generation += 1
+
+        # worker processes only receive the snapshot once, when they start, so replace the pool
+        if self._workers > 0:
+            from concurrent.futures import ProcessPoolExecutor
+
+            old_executor = self._executor
+            self._executor = ProcessPoolExecutor(self._workers, initializer=_install_graph,
+                                                 initargs=(self._snapshot,))
+            if old_executor is not None:
+                old_executor.shutdown(wait=False)
+
+    async def _query(self, method: str, src):
+        """
+        Runs a query, or joins an identical query that is already running
+        :param method: string naming a query method of the frozen graph
+        :param src: vertex the query starts from
+        :return: the query method's result, shared with any other caller of the same query
+        """
+        key = (self._generation, method, src)
+        future = self._in_flight.get(key)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if self._executor is not None:
+                future = loop.run_in_executor(self._executor, _run_query, method, src)
+            else:
+                future = loop.run_in_executor(None, getattr(self._snapshot, method), src)
+
+            # forget the query once it finishes, so later calls see fresh state after a reload
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # shield, so one cancelled caller does not cancel the computation for everyone else
+        return await asyncio.shield(future)
+
+    async def shortest_paths(self, src) -> list:
+        """
+        Computes shortest path lengths from one vertex to every vertex
+        Only supported for directed graphs
+        :param src: int identifying the source vertex
+        :return: list of distances, indexed by vertex, with infinity for unreachable vertices
+        """
+        distances = await self._query('dijkstra', src)
+        _check_vertex(src, len(distances))
+        return list(distances)
+
+    async def distance(self, src, dst):
+        """
+        Computes the length of the shortest path between two vertices
+        Only supported for directed graphs
+        :param src: int identifying the source vertex
+        :param dst: int identifying the destination vertex
+        :return: length of the shortest path, or infinity if dst is unreachable
+        """
+        distances = await self._query('dijkstra', src)
+        _check_vertex(src, len(distances))
+        _check_vertex(dst, len(distances))
+        return distances[dst]
+
+    async def traverse(self, src, order: str = 'bfs') -> list:
+        """
+        Lists the vertices reachable from a vertex, in visitation order
+        :param src: vertex to start from
+        :param order: (optional) 'bfs' or 'dfs'
+        :return: list of visited vertices
+        """
+        if order not in ('bfs', 'dfs'):
+            raise ValueError(f'unknown traversal order {order!r}')
+
+        return list(await self._query(order, src))
+
+    async def reachable(self, src, dst) -> bool:
+        """
+        Checks whether one vertex can be reached from another
+        :param src: vertex to start from
+        :param dst: vertex to look for
+        :return: True if there is a path from src to dst; False otherwise
+        """
+        return dst in await self._query('bfs', src)
+
+    async def handle_request(self, request: dict) -> dict:
+        """
+        Answers one decoded request
+        Requests look like {"op": "distance", "src": 0, "dst": 3}; op is one of
+            shortest_paths, distance, traverse, reachable
+        :param request: dict describing the request
+        :return: dict with a "result" key, or an "error" key if the request could not be answered
+        """
+        if not isinstance(request, dict):
+            return {'error': 'request must be a JSON object'}
+
+        try:
+            op = request['op']
+            if op == 'shortest_paths':
+                result = await self.shortest_paths(request['src'])
+            elif op == 'distance':
+                result = await self.distance(request['src'], request['dst'])
+            elif op == 'traverse':
+                result = await self.traverse(request['src'], request.get('order', 'bfs'))
+            elif op == 'reachable':
+                result = await self.reachable(request['src'], request['dst'])
+            else:
+                return {'error': f'unknown op {op!r}'}
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError) as error:
+            return {'error': f'{type(error).__name__}: {error}'}
+
+        return {'result': result}
+
+    async def _handle_connection(self, reader, writer) -> None:
+        """
+        Answers newline-delimited JSON requests from one client, one JSON response line per request
+        Responses to pipelined requests may arrive out of order; each echoes the request's "id", if any
+        :param reader: asyncio.StreamReader for the client
+        :param writer: asyncio.StreamWriter for the client
+        """
+        async def respond(request):
+            response = await self.handle_request(request)
+            if isinstance(request, dict) and 'id' in request:
+                response['id'] = request['id']
+            # json has no infinity, so unreachable distances are sent as null
+            writer.write(json.dumps(_without_infinity(response)).encode() + b'\n')
+
+        pending = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    writer.write(b'{"error": "malformed request"}\n')
+                    continue
+
+                # answer requests concurrently, so pipelined requests can share computations
+                task = asyncio.ensure_future(respond(request))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            if pending:
+                await asyncio.gather(*pending)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765) -> None:
+        """
+        Listens for clients until cancelled
+        :param host: (optional) string naming the interface to listen on
+        :param port: (optional) int port to listen on
+        """
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes, if any
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def _check_vertex(vertex, v_count: int) -> None:
+    """
+    Rejects a vertex number that is out of range for a directed graph
+    dijkstra() returns all infinities for an unknown source, and a negative index would count from the end,
+        so neither can be left to the list lookup
+    :param vertex: int identifying a vertex
+    :param v_count: int count of vertices in the graph
+    """
+    if not 0 <= vertex < v_count:
+        raise ValueError(f'{vertex!r} is not a vertex')
+
+
+def _without_infinity(value):
+    """
+    Replaces infinite floats with None, recursively through lists and dicts
+    :param value: any JSON-like value
+    :return: the value with every infinity replaced by None
+    """
+    if isinstance(value, float) and value == float('inf'):
+        return None
+    if isinstance(value, list):
+        return [_without_infinity(element) for element in value]
+    if isinstance(value, dict):
+        return {key: _without_infinity(element) for key, element in value.items()}
+    return value
+
+
+if __name__ == '__main__':
+
+    from .d_graph import DirectedGraph
+
+    edges = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3),
+             (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+    service = GraphQueryService(DirectedGraph(edges))
+    try:
+        asyncio.run(service.serve())
+    finally:
+        service.close()
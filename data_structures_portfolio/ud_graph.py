@@ -0,0 +1,1191 @@
+# Course: CS 261
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Implements a class for creating, manipulating, and querying an undirected graph
+
+
+from .stack import Stack
+from .paths import flatten_paths
+from collections import deque
+from collections.abc import Mapping
+from heapq import heappush, heappop
+from array import array
+from bisect import bisect_left
+
+
+class UndirectedGraph:
+    """
+    Class to implement undirected graph
+    - duplicate edges not allowed
+    - loops not allowed
+    - optional positive edge weights; an edge added without one weighs 1
+    - vertex names are strings
+    """
+    # {(vertex, other_vertex): weight} for every edge, keyed by the pair in sorted order; built on first use
+    # doubles as the edge index, answering "does this edge exist?" with one hash lookup
+    _edge_weights = None
+
+    def __init__(self, start_edges=None):
+        """
+        Store graph info as adjacency list
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        self.adj_list = dict()
+
+        # populate graph with initial vertices and edges (if provided)
+        # before using, implement add_vertex() and add_edge() methods
+        if start_edges is not None:
+            for u, v in start_edges:
+                self.add_edge(u, v)
+
+    def __str__(self):
+        """
+        Return content of the graph in human-readable form
+        DO NOT CHANGE THIS METHOD IN ANY WAY
+        """
+        out = [f'{v}: {self.adj_list[v]}' for v in self.adj_list]
+        out = '\n  '.join(out)
+        if len(out) < 70:
+            out = out.replace('\n  ', ', ')
+            return f'GRAPH: {{{out}}}'
+        return f'GRAPH: {{\n  {out}}}'
+
+    # ------------------------------------------------------------------ #
+
+    def is_in_graph(self, vertex: str) -> bool:
+        """
+        Checks whether a vertex is in the graph
+        :param vertex: string indicating the vertex to check
+        :return: True if the vertex is in the graph; False otherwise
+        """
+        try:
+            # test by trying to access the vertex
+            copy = self.adj_list[vertex]
+        except KeyError:
+            return False
+
+        # passed the test; it's in the graph
+        return True
+
+    def are_connected(self, vertex_1: str, vertex_2: str) -> bool:
+        """
+        Checks whether two vertices are connected by an edge
+        Vertices must be valid and different
+        :param vertex_1: string identifying a valid vertex
+        :param vertex_2: string identifying a different valid vertex
+        :return: True if the vertices are connected; False otherwise
+        """
+        return self.has_edge(vertex_1, vertex_2)
+
+    def has_edge(self, vertex_1: str, vertex_2: str) -> bool:
+        """
+        Checks whether two vertices are connected by an edge, in O(1)
+        :param vertex_1: string identifying a vertex
+        :param vertex_2: string identifying a vertex
+        :return: True if both vertices are in the graph and connected; False otherwise
+        """
+        return self._edge_key(vertex_1, vertex_2) in self._weight_table()
+
+    def degree(self, vertex: str) -> int:
+        """
+        Returns the number of edges incident to a vertex
+        :param vertex: string identifying a valid vertex
+        :return: int count of the vertex's edges
+        """
+        return len(self.adj_list[vertex])
+
+    @property
+    def edge_count(self) -> int:
+        """
+        Counts the edges in the graph
+        """
+        return len(self._weight_table())
+
+    def add_vertex(self, vertex: str) -> None:
+        """
+        Adds a new vertex to the graph
+        Duplicates are silently rejected
+        :param vertex: string to add as a new vertex. Vertices can be any string
+        """
+        # silently reject duplicates
+        if self.is_in_graph(vertex):
+            return
+
+        # add the new vertex string as a key in the adj_list
+        self.adj_list[vertex] = []
+
+    @staticmethod
+    def _edge_key(vertex_1: str, vertex_2: str) -> tuple:
+        """
+        Returns the key identifying an edge in the weight table
+        :param vertex_1: string identifying a vertex
+        :param vertex_2: string identifying another vertex
+        :return: tuple of the two vertices, in sorted order
+        """
+        if vertex_1 <= vertex_2:
+            return vertex_1, vertex_2
+        return vertex_2, vertex_1
+
+    def _weight_table(self) -> dict:
+        """
+        Returns the table of edge weights, building it from the adjacency list the first time
+        :return: dict of {edge key: weight}
+        """
+        if self._edge_weights is None:
+            self._edge_weights = {}
+            for vertex in self.adj_list:
+                for other_vertex in self.adj_list[vertex]:
+                    self._edge_weights[self._edge_key(vertex, other_vertex)] = 1
+
+        return self._edge_weights
+
+    def add_edge(self, vertex_1: str, vertex_2: str, weight=None) -> None:
+        """
+        Adds a new edge to the graph, connecting two vertices with the provided names
+        If a vertex does not exist in the graph, it will be created, then the edge will be added
+        If both params refer to the same vertex or the weight is not positive, nothing happens
+        If the edge already exists, its weight is updated if a weight is given; otherwise nothing happens
+        :param vertex_1: string identifying a vertex
+        :param vertex_2: string identifying a vertex to connect to vertex_1
+        :param weight: (optional) positive number. If not provided, a new edge weighs 1
+        """
+        # if the vertices are the same, do nothing
+        if vertex_1 == vertex_2:
+            return
+
+        # check for invalid weight
+        if weight is not None and weight <= 0:
+            return
+
+        # if a vertex is not in the graph yet, add it
+        if not self.is_in_graph(vertex_1):
+            self.add_vertex(vertex_1)
+        if not self.is_in_graph(vertex_2):
+            self.add_vertex(vertex_2)
+
+        # if the edge already exists, only update its weight
+        weights = self._weight_table()
+        if self.are_connected(vertex_1, vertex_2):
+            if weight is not None:
+                weights[self._edge_key(vertex_1, vertex_2)] = weight
+            return
+
+        # mutually connect vertices by adding them to each other's list
+        self.adj_list[vertex_1].append(vertex_2)
+        self.adj_list[vertex_2].append(vertex_1)
+        weights[self._edge_key(vertex_1, vertex_2)] = 1 if weight is None else weight
+
+    def remove_edge(self, vertex_1: str, vertex_2: str) -> None:
+        """
+        Removes an edge from the graph
+        If a vertex name does not exist in the graph, or if there is no edge between them, nothing happens
+        :param vertex_1: string identifying a vertex
+        :param vertex_2: string identifying a vertex connected to vertex_1 whose edge will be removed
+        """
+        # make sure the vertices are in the graph
+        if not self.is_in_graph(vertex_1) or not self.is_in_graph(vertex_2):
+            return
+
+        # make sure the vertices are connected by an edge
+        if not self.are_connected(vertex_1, vertex_2):
+            return
+
+        # remove the edge by removing vertices from each other's list
+        self.adj_list[vertex_1].remove(vertex_2)
+        self.adj_list[vertex_2].remove(vertex_1)
+        self._weight_table().pop(self._edge_key(vertex_1, vertex_2), None)
+
+    def remove_vertex(self, vertex: str) -> None:
+        """
+        Removes a vertex and all connected edges
+        If the vertex does not exist in the graph, nothing happens
+        :param vertex: string identifying a vertex
+        """
+        # make sure the vertex is in the graph
+        if not self.is_in_graph(vertex):
+            return
+
+        # remove the old vertex's edges; only its neighbors can hold one
+        weights = self._weight_table()
+        for other_vertex in self.adj_list[vertex]:
+            weights.pop(self._edge_key(vertex, other_vertex), None)
+            self.adj_list[other_vertex].remove(vertex)
+
+        # remove the vertex
+        del self.adj_list[vertex]
+
+    def get_vertices(self) -> list:
+        """
+        Returns a list of vertices in the graph (not in any order)
+        """
+        return [vertex for vertex in self.adj_list.keys()]
+
+    def get_edges(self) -> list:
+        """
+        Returns a list of edges in the graph (not in any order)
+        :return: list of edges, where an edge is a tuple of two strings identifying incident vertices
+        """
+        # prepare return variable
+        edges = []
+
+        # create all the edge tuple-pairs needed to describe each vertex's connections
+        for vertex in self.adj_list:
+            connections = self.adj_list[vertex]
+
+            # if this vertex has any edges, add them to the output
+            if len(connections) > 0:
+                for other_vertex in connections:
+                    edge = vertex, other_vertex
+
+                    # only add the edge if its reverse hasn't already been added
+                    reverse_edge = other_vertex, vertex
+                    if reverse_edge not in edges:
+                        edges.append(edge)
+
+        return edges
+
+    def edge_weight(self, vertex_1: str, vertex_2: str):
+        """
+        Returns the weight of the edge between two vertices
+        :param vertex_1: string identifying a vertex
+        :param vertex_2: string identifying another vertex
+        :return: the edge's weight, or 0 if there is no such edge
+        """
+        return self._weight_table().get(self._edge_key(vertex_1, vertex_2), 0)
+
+    def get_weighted_edges(self) -> list:
+        """
+        Returns a list of edges in the graph with their weights (not in any order)
+        :return: list of (vertex, other_vertex, weight) tuples, one per edge
+        """
+        return [(vertex, other_vertex, weight) for (vertex, other_vertex), weight in self._weight_table().items()]
+
+    def is_valid_path(self, path: list) -> bool:
+        """
+        Validates a given path
+        An empty path is considered valid
+        :param path: list of strings identifying the vertices in the path
+        :return: True if the path is valid; False otherwise
+        """
+        # handle empty path
+        if len(path) == 0:
+            return True  # by default
+
+        # make sure the first vertex is in the graph
+        if not self.is_in_graph(path[0]):
+            return False
+
+        # search along given path from the first vertex to check all other vertices
+        for index in range(len(path) - 1):  # stop before last element, because loop accesses index+1
+            vertex = path[index]
+            next_vertex = path[index + 1]
+
+            # make sure the next_vertex in the given path is reachable from this vertex
+            if not self.has_edge(vertex, next_vertex):
+                # the next vertex in the path is not reachable from this vertex
+                return False
+
+        # passed above test; path is valid
+        return True
+
+    def validate_paths(self, paths, offsets=None) -> tuple:
+        """
+        Checks many paths at once, with the same rules as is_valid_path()
+        Each hop is one lookup in the hashed edge table, rather than a scan of an adjacency list
+        Paths are given either as a list of paths, or as one flat list of vertices plus offsets,
+            where path i is paths[offsets[i]:offsets[i + 1]]
+        :param paths: list of lists of strings, or flat list of strings if offsets is given
+        :param offsets: (optional) list of path count + 1 ints marking where each path starts in paths;
+            they must not decrease or run past the end of paths, or ValueError is raised
+        :return: tuple of (list of bools, one per path, True where the path is valid,
+                           list of ints, one per path: the position of the first vertex that can't be reached,
+                           0 if the path's first vertex is not in the graph, or -1 if the path is valid)
+        """
+        flat, offsets = flatten_paths(paths, offsets)
+
+        # bind lookups once, since this loop runs once per hop of every path
+        edges = self._weight_table()  # the edge index
+        edge_key = self._edge_key
+        valid = []
+        failures = []
+
+        for path_index in range(len(offsets) - 1):
+            start, end = offsets[path_index], offsets[path_index + 1]
+            failure = -1
+
+            if start < end and flat[start] not in self.adj_list:
+                failure = 0
+            else:
+                for index in range(start, end - 1):
+                    if edge_key(flat[index], flat[index + 1]) not in edges:
+                        failure = index + 1 - start
+                        break
+
+            valid.append(failure == -1)
+            failures.append(failure)
+
+        return valid, failures
+
+    def dfs(self, v_start, v_end=None):
+        """
+        Return list of vertices visited during DFS search, in visitation order
+        Vertices are picked in alphabetical order
+        If the starting vertex is not in the graph, returns an empty list
+        Based on https://www.tutorialspoint.com/data_structures_algorithms/depth_first_traversal.htm
+        :param v_start: string identifying the starting vertex
+        :param v_end: (optional) string identifying the vertex after which to end the search early
+                      if v_end is not in the graph, the whole graph is searched
+        :return: list of strings identifying the visited vertices, or empty list if v_start isn't in the graph
+        """
+        # make sure v_start is in the graph
+        if not self.is_in_graph(v_start):
+            return []
+
+        # make a list of visited vertices
+        visited = set()
+        visited.add(v_start)
+
+        # make a stack of vertices to visit, used in loop
+        to_visit = Stack(v_start)
+
+        # visit all direct successors in order
+        vertex = v_start
+        while not to_visit.is_empty() and vertex != v_end:
+            # search unvisited direct successors for the next vertex
+            # sort a copy, so searching never reorders the graph's own lists
+            successors_ordered = sorted(self.adj_list[vertex], reverse=True)
+            has_eligible_successor = False
+            for potential_successor in successors_ordered:
+                if potential_successor not in visited:
+                    # visit this vertex next--overwritten until it is the smallest potential successor
+                    vertex = potential_successor
+
+                    # keep a trail of breadcrumbs for backtracking
+                    to_visit.push(potential_successor)
+
+                    # don't use the breadcrumbs this time
+                    has_eligible_successor = True
+
+            # if there weren't any eligible successors, backtrack
+            if not has_eligible_successor:
+                vertex = to_visit.pop()
+
+            # mark this vertex as visited (if it hasn't been counted yet)
+            if vertex not in visited:
+                visited.append(vertex)
+
+        return visited
+
+    def bfs(self, v_start, v_end=None, workers: int = None) -> []:
+        """
+        Returns a list of vertices visited during BFS search, in visitation order
+        Vertices are picked in alphabetical order
+        If the starting vertex is not in the graph, returns an empty list
+        Based on https://www.tutorialspoint.com/data_structures_algorithms/breadth_first_traversal.htm
+        :param v_start: string identifying the starting vertex
+        :param v_end: (optional) string identifying the vertex after which to end the search early
+                      if v_end is not in the graph, the whole graph is searched
+        :param workers: (optional) int; if given, search level by level using this many worker processes
+        :return: list of strings identifying the visited vertices, or empty list if v_start isn't in the graph
+        """
+        if workers is not None:
+            from .parallel_graph import parallel_bfs
+            return parallel_bfs(self, v_start, v_end, workers)
+
+        # make sure v_start is in the graph
+        if not self.is_in_graph(v_start):
+            return []
+
+        # make a list of visited vertices
+        visited = set()
+        visited.add(v_start)
+
+        # make a dequeue of vertices to visit, used in loop
+        to_visit = deque(v_start)
+
+        # visit all direct successors of each vertex in order
+        vertex = v_start
+        exit_early = False  # flag for honoring v_end
+        while len(to_visit) != 0 and vertex != v_end and exit_early is False:
+            # get the next vertex
+            vertex = to_visit.popleft()
+
+            # visit all unvisited direct successors and insert them into the queue
+            successors_ordered = sorted(self.adj_list[vertex])
+            for successor in successors_ordered:
+                # mark this vertex as visited (if it hasn't been marked visited yet)
+                if successor not in visited:
+                    visited.add(successor)
+
+                    # terminate early if asked to by caller
+                    if successor == v_end:
+                        exit_early = True
+                        break
+
+                    # add this vertex to the itinerary for visiting later, in case it has unvisited descendants
+                    if successor not in to_visit:
+                        to_visit.append(successor)
+
+        return visited
+
+    def count_connected_components(self, workers: int = None) -> int:
+        """
+        Returns the number of connected components in the graph
+        :param workers: (optional) int; if given, split the work among this many worker processes
+        :return: int showing the number of connected components in the graph
+        """
+        if workers is not None:
+            from .parallel_graph import parallel_connected_components
+            return parallel_connected_components(self, workers)
+
+        # check all vertices in the graph
+        subgraphs = set()
+        for vertex in self.adj_list:
+            # if the vertex is not in any previously identified subgraph,
+            already_identified = False
+            for subgraph in subgraphs:
+                if vertex in subgraph:
+                    already_identified = True
+                    break
+
+            # get all the vertices reachable from it (including the starting vertex)
+            if not already_identified:
+                new_subgraph = self.bfs(vertex)
+                subgraphs.add(new_subgraph)
+
+        # after all vertices' subgraph paths have been traversed, return the total number of paths
+        return len(subgraphs)
+
+    def seek_cycle(self, vertex: str, previous: str, visited: set) -> bool:
+        """
+        Finds a cycle in the connected component containing the given vertex, if a cycle exists
+        Helper for has_cycle()
+        Based on https://www.baeldung.com/cs/cycles-undirected-graph
+        :param vertex: string identifying the next vertex to visit
+        :param previous: string identifying the vertex visited in the previous visit() call
+        :param visited: set memoizing visited vertices
+        :return: True if the graph contains a cycle; False otherwise
+        """
+        # mark this index as visited
+        visited.add(vertex)
+
+        # recursive case: search all direct descendants, and visit all which are unvisited
+        successors = self.adj_list[vertex]
+        for neighbor in successors:
+            # base case 1: found a cycle
+            if neighbor in visited:
+                if neighbor != previous:
+                    return True
+            # recursive case: test this neighbor's neighbors
+            elif self.seek_cycle(neighbor, vertex, visited):
+                return True
+
+        # base case 2: visited all vertices in this connected component
+        return False
+
+    def has_cycle(self):
+        """
+        Checks whether the graph contains a cycle
+        :return: True if the graph contains a cycle; False otherwise
+        """
+        # handle edge cases
+        if len(self.adj_list) == 0:
+            # an empty graph is acyclic
+            return False
+        elif len(self.adj_list) == 1:
+            # a singleton graph is cyclic
+            return True
+
+        # search each vertex
+        for v_start in self.adj_list:
+            if self.seek_cycle(v_start, None, []):
+                return True
+
+        # passed cycle test; graph has no cycle
+        return False
+
+    def minimum_spanning_tree(self, algorithm: str = 'kruskal') -> tuple:
+        """
+        Finds a minimum spanning forest: a minimum spanning tree of each connected component
+        :param algorithm: (optional) 'kruskal' to sort the edges and join components with a union-find,
+                          or 'prim' to grow each tree from a heap of the edges leaving it
+        :return: tuple of (list of (vertex, other_vertex, weight) edges in the forest, total weight)
+        """
+        if algorithm == 'kruskal':
+            forest = self._kruskal()
+        elif algorithm == 'prim':
+            forest = self._prim()
+        else:
+            raise ValueError(f'unknown algorithm {algorithm!r}')
+
+        return forest, sum(weight for _, _, weight in forest)
+
+    def _kruskal(self) -> list:
+        """
+        Finds a minimum spanning forest with Kruskal's algorithm
+        Helper for minimum_spanning_tree()
+        :return: list of (vertex, other_vertex, weight) edges in the forest
+        """
+        weights = self._weight_table()
+        forest = []
+        forest_size = len(self.adj_list) - 1
+
+        # union-find over vertex names: each vertex points toward the representative of its tree
+        parent = {vertex: vertex for vertex in self.adj_list}
+        size = {vertex: 1 for vertex in self.adj_list}
+
+        def find(vertex):
+            while parent[vertex] != vertex:
+                # point at the grandparent as we go, keeping paths short
+                parent[vertex] = parent[parent[vertex]]
+                vertex = parent[vertex]
+            return vertex
+
+        # sort the existing keys by weight rather than building a list of new edge tuples
+        for key in sorted(weights, key=weights.__getitem__):
+            if len(forest) >= forest_size:
+                break
+
+            root_1, root_2 = find(key[0]), find(key[1])
+            if root_1 == root_2:
+                # both ends are already in the same tree; this edge would close a cycle
+                continue
+
+            # hang the smaller tree under the larger one
+            if size[root_1] < size[root_2]:
+                root_1, root_2 = root_2, root_1
+            parent[root_2] = root_1
+            size[root_1] += size[root_2]
+
+            forest.append((key[0], key[1], weights[key]))
+
+        return forest
+
+    def _prim(self) -> list:
+        """
+        Finds a minimum spanning forest with Prim's algorithm, starting a new tree in each component
+        Helper for minimum_spanning_tree()
+        :return: list of (vertex, other_vertex, weight) edges in the forest
+        """
+        weights = self._weight_table()
+        forest = []
+        in_tree = set()
+
+        for root in self.adj_list:
+            if root in in_tree:
+                continue
+
+            # grow a tree from root, always taking the lightest edge leaving it
+            in_tree.add(root)
+            to_visit = []
+            for neighbor in self.adj_list[root]:
+                heappush(to_visit, (weights[self._edge_key(root, neighbor)], root, neighbor))
+
+            while len(to_visit) > 0:
+                weight, vertex, neighbor = heappop(to_visit)
+                if neighbor in in_tree:
+                    continue
+
+                in_tree.add(neighbor)
+                forest.append((vertex, neighbor, weight))
+                for next_neighbor in self.adj_list[neighbor]:
+                    if next_neighbor not in in_tree:
+                        heappush(to_visit, (weights[self._edge_key(neighbor, next_neighbor)], neighbor, next_neighbor))
+
+        return forest
+
+    def subgraph(self, vertices=None, min_weight=None, max_weight=None) -> 'UndirectedSubgraphView':
+        """
+        Returns a read-only view of part of the graph, filtered on the fly without copying
+        The view follows later changes to this graph
+        :param vertices: (optional) iterable of strings; if given, only these vertices and the edges between them are kept
+        :param min_weight: (optional) number; if given, lighter edges are hidden
+        :param max_weight: (optional) number; if given, heavier edges are hidden
+        :return: UndirectedSubgraphView supporting the query methods of UndirectedGraph
+        """
+        return UndirectedSubgraphView(self, vertices, min_weight, max_weight)
+
+    @classmethod
+    def from_edges(cls, edges, vertices=()) -> 'UndirectedGraph':
+        """
+        Builds a graph in one pass, filling the adjacency lists and weight table directly
+        Edges follow the same rules as add_edge(): loops and non-positive weights are skipped,
+            and a repeated edge keeps its last weight
+        :param edges: iterable of (vertex, other_vertex) or (vertex, other_vertex, weight) tuples
+        :param vertices: (optional) iterable of strings to add even if no edge touches them
+        :return: new UndirectedGraph
+        """
+        graph = cls()
+        graph._edge_weights = {}
+        for vertex in vertices:
+            graph.adj_list.setdefault(vertex, [])
+
+        for edge in edges:
+            vertex, other_vertex = edge[0], edge[1]
+            weight = edge[2] if len(edge) > 2 else 1
+            if vertex == other_vertex or weight <= 0:
+                continue
+
+            key = cls._edge_key(vertex, other_vertex)
+            if key not in graph._edge_weights:
+                graph.adj_list.setdefault(vertex, []).append(other_vertex)
+                graph.adj_list.setdefault(other_vertex, []).append(vertex)
+            graph._edge_weights[key] = weight
+
+        return graph
+
+    def induced_subgraph(self, vertices) -> 'UndirectedGraph':
+        """
+        Copies the part of the graph spanned by some vertices into a new graph in one pass
+        :param vertices: iterable of strings; vertices not in the graph are ignored
+        :return: new UndirectedGraph holding the kept vertices, the edges between them, and their weights
+        """
+        kept = set(vertex for vertex in vertices if self.is_in_graph(vertex))
+        weights = self._weight_table()
+
+        # fill in the new graph's storage directly, rather than through add_edge()
+        subgraph = UndirectedGraph()
+        subgraph._edge_weights = {}
+        for vertex in self.adj_list:
+            if vertex in kept:
+                subgraph.adj_list[vertex] = [neighbor for neighbor in self.adj_list[vertex] if neighbor in kept]
+                for neighbor in subgraph.adj_list[vertex]:
+                    key = self._edge_key(vertex, neighbor)
+                    subgraph._edge_weights[key] = weights[key]
+
+        return subgraph
+
+    def freeze(self) -> 'FrozenUndirectedGraph':
+        """
+        Returns an immutable snapshot of the graph for read-only queries
+        Later changes to this graph do not affect the snapshot
+        :return: FrozenUndirectedGraph holding the current vertices and edges
+        """
+        # number the vertices in alphabetical order, so sorted ids mean sorted names
+        names = tuple(sorted(self.adj_list))
+        index_of = {name: index for index, name in enumerate(names)}
+
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = []
+        edge_weights = self._weight_table()
+        for name in names:
+            for neighbor in sorted(index_of[neighbor] for neighbor in self.adj_list[name]):
+                targets.append(neighbor)
+                weights.append(edge_weights[self._edge_key(name, names[neighbor])])
+            offsets.append(len(targets))
+
+        return FrozenUndirectedGraph(names, offsets, targets, weights)
+
+
+class UndirectedSubgraphView(UndirectedGraph):
+    """
+    Class to implement a read-only view of part of an UndirectedGraph
+    - hidden vertices and edges are filtered out on each access; nothing is copied
+    - changes to the parent graph show through immediately
+    - edge_count and whole-graph queries filter every edge on each call
+    - use UndirectedGraph.induced_subgraph() instead when the same part will be queried many times
+    """
+
+    def __init__(self, parent: UndirectedGraph, vertices=None, min_weight=None, max_weight=None):
+        """
+        Creates the view
+        Use UndirectedGraph.subgraph() rather than calling this directly
+        :param parent: UndirectedGraph to view
+        :param vertices: (optional) iterable of strings to keep. If not provided, all vertices are kept
+        :param min_weight: (optional) number; if given, lighter edges are hidden
+        :param max_weight: (optional) number; if given, heavier edges are hidden
+        """
+        self._parent = parent
+        self._vertices = None if vertices is None else frozenset(vertices)
+        self._min_weight = min_weight
+        self._max_weight = max_weight
+        self._adjacency = _FilteredAdjacency(self)
+
+    @property
+    def adj_list(self) -> '_FilteredAdjacency':
+        return self._adjacency
+
+    def keeps_vertex(self, vertex: str) -> bool:
+        """
+        Checks whether a vertex of the parent graph is visible in the view
+        :param vertex: string identifying a vertex of the parent graph
+        :return: True if the vertex is kept; False otherwise
+        """
+        return self._parent.is_in_graph(vertex) and (self._vertices is None or vertex in self._vertices)
+
+    def keeps_weight(self, weight) -> bool:
+        """
+        Checks whether an edge of a given weight is visible in the view
+        :param weight: weight of an edge of the parent graph
+        :return: True if edges of this weight are kept; False otherwise
+        """
+        if self._min_weight is not None and weight < self._min_weight:
+            return False
+        if self._max_weight is not None and weight > self._max_weight:
+            return False
+
+        return True
+
+    def edge_weight(self, vertex_1: str, vertex_2: str):
+        """
+        Returns the weight of the edge between two vertices, as seen through the view
+        :param vertex_1: string identifying a vertex
+        :param vertex_2: string identifying another vertex
+        :return: the edge's weight, or 0 if there is no such edge or it is hidden
+        """
+        if not self.keeps_vertex(vertex_1) or not self.keeps_vertex(vertex_2):
+            return 0
+
+        weight = self._parent.edge_weight(vertex_1, vertex_2)
+        if weight == 0 or not self.keeps_weight(weight):
+            return 0
+
+        return weight
+
+    def has_edge(self, vertex_1: str, vertex_2: str) -> bool:
+        """
+        Checks whether two vertices are connected by a visible edge, in O(1)
+        :param vertex_1: string identifying a vertex
+        :param vertex_2: string identifying a vertex
+        :return: True if both vertices are visible and connected by a visible edge; False otherwise
+        """
+        return self.edge_weight(vertex_1, vertex_2) != 0
+
+    def _weight_table(self) -> dict:
+        """
+        Returns the visible part of the parent's table of edge weights, built fresh on each call
+        :return: dict of {edge key: weight}
+        """
+        return {key: weight for key, weight in self._parent._weight_table().items()
+                if self.keeps_weight(weight) and self.keeps_vertex(key[0]) and self.keeps_vertex(key[1])}
+
+    def add_vertex(self, vertex: str) -> None:
+        raise TypeError('subgraph views are read-only; change the parent graph instead')
+
+    def add_edge(self, vertex_1: str, vertex_2: str, weight=None) -> None:
+        raise TypeError('subgraph views are read-only; change the parent graph instead')
+
+    def remove_edge(self, vertex_1: str, vertex_2: str) -> None:
+        raise TypeError('subgraph views are read-only; change the parent graph instead')
+
+    def remove_vertex(self, vertex: str) -> None:
+        raise TypeError('subgraph views are read-only; change the parent graph instead')
+
+
+class _FilteredAdjacency(Mapping):
+    """
+    Class to implement the adj_list of an UndirectedSubgraphView, hiding filtered vertices and edges
+    """
+
+    def __init__(self, view: UndirectedSubgraphView):
+        self._view = view
+
+    def __getitem__(self, vertex: str) -> list:
+        if not self._view.keeps_vertex(vertex):
+            raise KeyError(vertex)
+
+        return [neighbor for neighbor in self._view._parent.adj_list[vertex]
+                if self._view.has_edge(vertex, neighbor)]
+
+    def __iter__(self):
+        for vertex in self._view._parent.adj_list:
+            if self._view.keeps_vertex(vertex):
+                yield vertex
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, vertex) -> bool:
+        return self._view.keeps_vertex(vertex)
+
+
+class FrozenUndirectedGraph:
+    """
+    Class to implement an immutable snapshot of an UndirectedGraph
+    - vertices are numbered in alphabetical order of their names
+    - edges are stored in both directions as compressed sparse rows in typed arrays, with weights parallel to targets
+    - each vertex's neighbors are sorted alphabetically
+    - instances never change after creation, so they can be shared between threads without locks
+    - instances are hashable and pickle as a tuple of names plus three flat arrays
+    """
+    __slots__ = ('_names', '_index_of', '_offsets', '_targets', '_weights', '_hash')
+
+    def __init__(self, names: tuple, offsets, targets, weights):
+        """
+        Stores a snapshot in compressed sparse row form
+        Use UndirectedGraph.freeze() rather than calling this directly
+        :param names: tuple of vertex names, sorted alphabetically
+        :param offsets: sequence of len(names) + 1 ints; neighbors of vertex i are targets[offsets[i]:offsets[i + 1]]
+        :param targets: sequence of int vertex numbers, sorted within each vertex's run
+        :param weights: sequence of positive edge weights, parallel to targets
+        """
+        # integer weights stay integers; anything else is stored as a double
+        if not isinstance(weights, array):
+            typecode = 'q' if all(isinstance(weight, int) for weight in weights) else 'd'
+            weights = array(typecode, weights)
+
+        object.__setattr__(self, '_names', tuple(names))
+        object.__setattr__(self, '_index_of', {name: index for index, name in enumerate(names)})
+        object.__setattr__(self, '_offsets', array('q', offsets))
+        object.__setattr__(self, '_targets', array('q', targets))
+        object.__setattr__(self, '_weights', weights)
+        object.__setattr__(self, '_hash', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FrozenUndirectedGraph is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('FrozenUndirectedGraph is immutable')
+
+    def __reduce__(self):
+        return FrozenUndirectedGraph, (self._names, self._offsets, self._targets, self._weights)
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenUndirectedGraph):
+            return NotImplemented
+        return (self._names == other._names and self._offsets == other._offsets
+                and self._targets == other._targets and self._weights == other._weights)
+
+    def __hash__(self):
+        # hashing walks every edge, so only do it once
+        if self._hash is None:
+            value = hash((self._names, self._offsets.tobytes(), self._targets.tobytes(), tuple(self._weights)))
+            object.__setattr__(self, '_hash', value)
+        return self._hash
+
+    def __str__(self):
+        return f'FROZEN GRAPH ({len(self._names)} vertices, {len(self._targets) // 2} edges)'
+
+    def _neighbors(self, index: int):
+        """
+        Returns the vertex numbers adjacent to one vertex number, alphabetically
+        :param index: int identifying a vertex by number
+        :return: array of int vertex numbers
+        """
+        return self._targets[self._offsets[index]:self._offsets[index + 1]]
+
+    def csr(self) -> tuple:
+        """
+        Returns the snapshot's raw storage, for code that works on vertex numbers directly
+        :return: tuple of (names, offsets, targets); neighbors of vertex names[i] are
+            the vertex numbers targets[offsets[i]:offsets[i + 1]]
+        """
+        return self._names, self._offsets, self._targets
+
+    def vertex_number(self, vertex: str):
+        """
+        Returns the number csr() uses for a vertex
+        :param vertex: string identifying a vertex
+        :return: int index into the csr() names, or None if the vertex isn't in the graph
+        """
+        return self._index_of.get(vertex)
+
+    def is_in_graph(self, vertex: str) -> bool:
+        """
+        Checks whether a vertex is in the graph
+        :param vertex: string indicating the vertex to check
+        :return: True if the vertex is in the graph; False otherwise
+        """
+        return vertex in self._index_of
+
+    def are_connected(self, vertex_1: str, vertex_2: str) -> bool:
+        """
+        Checks whether two vertices are connected by an edge
+        :param vertex_1: string identifying a vertex
+        :param vertex_2: string identifying a vertex
+        :return: True if both vertices are in the graph and connected; False otherwise
+        """
+        index_1 = self._index_of.get(vertex_1)
+        index_2 = self._index_of.get(vertex_2)
+        if index_1 is None or index_2 is None:
+            return False
+
+        return self._edge_position(index_1, index_2) is not None
+
+    def _edge_position(self, index_1: int, index_2: int):
+        """
+        Finds where an edge is stored
+        :param index_1: int identifying a vertex by number
+        :param index_2: int identifying another vertex by number
+        :return: int index into targets and weights, or None if the vertices aren't connected
+        """
+        # neighbors are sorted, so a binary search finds the edge
+        start, end = self._offsets[index_1], self._offsets[index_1 + 1]
+        position = bisect_left(self._targets, index_2, start, end)
+        if position < end and self._targets[position] == index_2:
+            return position
+        return None
+
+    def edge_weight(self, vertex_1: str, vertex_2: str):
+        """
+        Returns the weight of the edge between two vertices
+        :param vertex_1: string identifying a vertex
+        :param vertex_2: string identifying another vertex
+        :return: the edge's weight, or 0 if there is no such edge
+        """
+        index_1 = self._index_of.get(vertex_1)
+        index_2 = self._index_of.get(vertex_2)
+        if index_1 is None or index_2 is None:
+            return 0
+
+        position = self._edge_position(index_1, index_2)
+        return 0 if position is None else self._weights[position]
+
+    def degree(self, vertex: str) -> int:
+        """
+        Returns the number of edges incident to a vertex
+        :param vertex: string identifying a valid vertex
+        :return: int count of the vertex's edges
+        """
+        index = self._index_of[vertex]
+        return self._offsets[index + 1] - self._offsets[index]
+
+    @property
+    def edge_count(self) -> int:
+        """
+        Counts the edges in the graph
+        """
+        return len(self._targets) // 2
+
+    def get_vertices(self) -> list:
+        """
+        Returns a list of vertices in the graph, in alphabetical order
+        """
+        return list(self._names)
+
+    def get_edges(self) -> list:
+        """
+        Returns a list of edges in the graph
+        :return: list of edges, where an edge is a tuple of two strings identifying incident vertices
+        """
+        edges = []
+        for index, name in enumerate(self._names):
+            for neighbor in self._neighbors(index):
+                # each edge is stored twice; keep the copy whose first vertex comes first
+                if neighbor > index:
+                    edges.append((name, self._names[neighbor]))
+
+        return edges
+
+    def get_weighted_edges(self) -> list:
+        """
+        Returns a list of edges in the graph with their weights
+        :return: list of (vertex, other_vertex, weight) tuples, one per edge, first vertex alphabetically first
+        """
+        edges = []
+        for index, name in enumerate(self._names):
+            for position in range(self._offsets[index], self._offsets[index + 1]):
+                neighbor = self._targets[position]
+                if neighbor > index:
+                    edges.append((name, self._names[neighbor], self._weights[position]))
+
+        return edges
+
+    def is_valid_path(self, path: list) -> bool:
+        """
+        Validates a given path
+        An empty path is considered valid
+        :param path: list of strings identifying the vertices in the path
+        :return: True if the path is valid; False otherwise
+        """
+        if len(path) == 0:
+            return True
+
+        if not self.is_in_graph(path[0]):
+            return False
+
+        for index in range(len(path) - 1):  # stop before last element, because loop accesses index+1
+            if not self.are_connected(path[index], path[index + 1]):
+                return False
+
+        return True
+
+    def dfs(self, v_start, v_end=None) -> list:
+        """
+        Return list of vertices visited during DFS search, in visitation order
+        Vertices are picked in alphabetical order
+        If the starting vertex is not in the graph, returns an empty list
+        :param v_start: string identifying the starting vertex
+        :param v_end: (optional) string identifying the vertex after which to end the search early
+        :return: list of strings identifying the visited vertices, or empty list if v_start isn't in the graph
+        """
+        if not self.is_in_graph(v_start):
+            return []
+
+        visited = []
+        seen = set()
+        to_visit = Stack([self._index_of[v_start]])
+
+        while not to_visit.is_empty():
+            index = to_visit.pop()
+            if index in seen:
+                continue
+
+            seen.add(index)
+            visited.append(self._names[index])
+            if self._names[index] == v_end:
+                break
+
+            # push the alphabetically last neighbor first, so the first one is popped next
+            for neighbor in reversed(self._neighbors(index)):
+                if neighbor not in seen:
+                    to_visit.push(neighbor)
+
+        return visited
+
+    def bfs(self, v_start, v_end=None) -> list:
+        """
+        Returns a list of vertices visited during BFS search, in visitation order
+        Vertices are picked in alphabetical order
+        If the starting vertex is not in the graph, returns an empty list
+        :param v_start: string identifying the starting vertex
+        :param v_end: (optional) string identifying the vertex after which to end the search early
+        :return: list of strings identifying the visited vertices, or empty list if v_start isn't in the graph
+        """
+        if not self.is_in_graph(v_start):
+            return []
+
+        visited = []
+        start = self._index_of[v_start]
+        seen = {start}
+        to_visit = deque([start])
+
+        while len(to_visit) != 0:
+            index = to_visit.popleft()
+            visited.append(self._names[index])
+            if self._names[index] == v_end:
+                break
+
+            for neighbor in self._neighbors(index):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    to_visit.append(neighbor)
+
+        return visited
+
+    def count_connected_components(self) -> int:
+        """
+        Returns the number of connected components in the graph
+        :return: int showing the number of connected components in the graph
+        """
+        seen = bytearray(len(self._names))
+        components = 0
+
+        for start in range(len(self._names)):
+            if seen[start]:
+                continue
+
+            # flood the new component
+            components += 1
+            seen[start] = 1
+            to_visit = [start]
+            while len(to_visit) > 0:
+                for neighbor in self._neighbors(to_visit.pop()):
+                    if not seen[neighbor]:
+                        seen[neighbor] = 1
+                        to_visit.append(neighbor)
+
+        return components
+
+    def has_cycle(self) -> bool:
+        """
+        Checks whether the graph contains a cycle
+        A forest has exactly (vertices - components) edges; any more edges must close a cycle
+        :return: True if the graph contains a cycle; False otherwise
+        """
+        edge_count = len(self._targets) // 2
+        return edge_count > len(self._names) - self.count_connected_components()
+
+
+if __name__ == '__main__':
+
+    # print("\nPDF - method add_vertex() / add_edge example 1")
+    # print("----------------------------------------------")
+    # g = UndirectedGraph()
+    # print(g)
+    #
+    # for v in 'ABCDE':
+    #     g.add_vertex(v)
+    # print(g)
+    #
+    # g.add_vertex('A')
+    # print(g)
+    #
+    # for u, v in ['AB', 'AC', 'BC', 'BD', 'CD', 'CE', 'DE', ('B', 'C')]:
+    #     g.add_edge(u, v)
+    # print(g)
+
+
+    # print("\nPDF - method remove_edge() / remove_vertex example 1")
+    # print("----------------------------------------------------")
+    # g = UndirectedGraph(['AB', 'AC', 'BC', 'BD', 'CD', 'CE', 'DE'])
+    # g.remove_vertex('DOES NOT EXIST')
+    # g.remove_edge('A', 'B')
+    # g.remove_edge('X', 'B')
+    # print(g)
+    # g.remove_vertex('D')
+    # print(g)
+    #
+    #
+    # print("\nPDF - method get_vertices() / get_edges() example 1")
+    # print("---------------------------------------------------")
+    # g = UndirectedGraph()
+    # print(g.get_edges(), g.get_vertices(), sep='\n')
+    # g = UndirectedGraph(['AB', 'AC', 'BC', 'BD', 'CD', 'CE'])
+    # print(g.get_edges(), g.get_vertices(), sep='\n')
+    #
+    #
+    # print("\nPDF - method is_valid_path() example 1")
+    # print("--------------------------------------")
+    # g = UndirectedGraph(['AB', 'AC', 'BC', 'BD', 'CD', 'CE', 'DE'])
+    # test_cases = ['ABC', 'ADE', 'ECABDCBE', 'ACDECB', '', 'D', 'Z']
+    # for path in test_cases:
+    #     print(list(path), g.is_valid_path(list(path)))
+    #
+    #
+    # print("\nPDF - method dfs() and bfs() example 1")
+    # print("--------------------------------------")
+    # edges = ['AE', 'AC', 'BE', 'CE', 'CD', 'CB', 'BD', 'ED', 'BH', 'QG', 'FG']
+    # g = UndirectedGraph(edges)
+    # test_cases = 'ABCDEGH'
+    # for case in test_cases:
+    #     print(f'{case} DFS:{g.dfs(case)} BFS:{g.bfs(case)}')
+    # print('-----')
+    # for i in range(1, len(test_cases)):
+    #     v1, v2 = test_cases[i], test_cases[-1 - i]
+    #     print(f'{v1}-{v2} DFS:{g.dfs(v1, v2)} BFS:{g.bfs(v1, v2)}')
+    #
+    #
+    # print("\nPDF - method count_connected_components() example 1")
+    # print("---------------------------------------------------")
+    # edges = ['AE', 'AC', 'BE', 'CE', 'CD', 'CB', 'BD', 'ED', 'BH', 'QG', 'FG']
+    # g = UndirectedGraph(edges)
+    # test_cases = (
+    #     'add QH', 'remove FG', 'remove GQ', 'remove HQ',
+    #     'remove AE', 'remove CA', 'remove EB', 'remove CE', 'remove DE',
+    #     'remove BC', 'add EA', 'add EF', 'add GQ', 'add AC', 'add DQ',
+    #     'add EG', 'add QH', 'remove CD', 'remove BD', 'remove QG')
+    # for case in test_cases:
+    #     command, edge = case.split()
+    #     u, v = edge
+    #     g.add_edge(u, v) if command == 'add' else g.remove_edge(u, v)
+    #     print(g.count_connected_components(), end=' ')
+    # print()
+    #
+    #
+    print("\nPDF - method has_cycle() example 1")
+    print("----------------------------------")
+    edges = ['AE', 'AC', 'BE', 'CE', 'CD', 'CB', 'BD', 'ED', 'BH', 'QG', 'FG']
+    g = UndirectedGraph(edges)
+    test_cases = (
+        'add QH', 'remove FG', 'remove GQ', 'remove HQ',
+        'remove AE', 'remove CA', 'remove EB', 'remove CE', 'remove DE',
+        'remove BC', 'add EA', 'add EF', 'add GQ', 'add AC', 'add DQ',
+        'add EG', 'add QH', 'remove CD', 'remove BD', 'remove QG',
+        'add FG', 'remove GE')
+    for case in test_cases:
+        command, edge = case.split()
+        u, v = edge
+        g.add_edge(u, v) if command == 'add' else g.remove_edge(u, v)
+        print('{:<10}'.format(case), g.has_cycle())
@@ -0,0 +1,427 @@
+# Course: CS261 - Data Structures
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Generates synthetic graphs, records traces of graph operations, and replays them with latency reports
+
+
+import argparse
+import gzip
+import json
+import logging
+import random
+import sys
+import time
+
+from .d_graph import DirectedGraph
+from .ud_graph import UndirectedGraph
+
+
+logger = logging.getLogger(__name__)
+
+# graph methods that can be recorded and replayed
+TRACED_OPS = frozenset([
+    'add_vertex', 'add_edge', 'remove_edge', 'remove_vertex',
+    'dijkstra', 'bounded_dijkstra', 'bfs', 'dfs', 'has_cycle', 'is_valid_path', 'count_connected_components',
+])
+
+GRAPH_KINDS = ('random', 'scale-free', 'grid', 'dag')
+
+
+def generate_edges(kind: str, v_count: int, e_count: int, seed: int = None, max_weight: int = 10) -> list:
+    """
+    Generates the edges of a synthetic graph
+    :param kind: one of
+        'random': e_count edges between uniformly random pairs of vertices
+        'scale-free': preferential attachment; each new vertex links to about e_count / v_count well-connected vertices
+        'grid': the largest square-ish grid with v_count vertices, each linked to its right and lower neighbor
+        'dag': e_count edges, each from a lower-numbered vertex to a higher-numbered one
+    :param v_count: int count of vertices, numbered 0 to v_count - 1
+    :param e_count: int count of edges wanted; ignored for 'grid'
+    :param seed: (optional) int seed, for repeatable graphs
+    :param max_weight: (optional) int; weights are drawn uniformly from 1 to max_weight
+    :return: list of (source, destination, weight) tuples, possibly with repeated pairs
+    """
+    rng = random.Random(seed)
+    edges = []
+    if v_count < 2:
+        return edges
+
+    if kind == 'random':
+        for _ in range(e_count):
+            edges.append((rng.randrange(v_count), rng.randrange(v_count), rng.randint(1, max_weight)))
+
+    elif kind == 'dag':
+        for _ in range(e_count):
+            src, dst = sorted(rng.sample(range(v_count), 2))
+            edges.append((src, dst, rng.randint(1, max_weight)))
+
+    elif kind == 'grid':
+        columns = max(1, int(v_count ** 0.5))
+        for vertex in range(v_count):
+            if (vertex + 1) % columns != 0 and vertex + 1 < v_count:
+                edges.append((vertex, vertex + 1, rng.randint(1, max_weight)))
+            if vertex + columns < v_count:
+                edges.append((vertex, vertex + columns, rng.randint(1, max_weight)))
+
+    elif kind == 'scale-free':
+        links = max(1, e_count // v_count)
+        # each vertex appears here once per edge it has, so picking uniformly favors well-connected vertices
+        endpoints = [0]
+        for vertex in range(1, v_count):
+            for target in set(rng.choice(endpoints) for _ in range(links)):
+                edges.append((vertex, target, rng.randint(1, max_weight)))
+                endpoints.extend((vertex, target))
+
+    else:
+        raise ValueError(f'unknown graph kind {kind!r}')
+
+    return edges
+
+
+def build_graph(edges: list, v_count: int, directed: bool):
+    """
+    Loads edges into a new graph through bulk construction
+    :param edges: list of (source, destination, weight) tuples with int vertices
+    :param v_count: int count of vertices
+    :param directed: True for a DirectedGraph; False for an UndirectedGraph with vertices named '0', '1', etc.
+    :return: DirectedGraph or UndirectedGraph
+    """
+    if directed:
+        return DirectedGraph.from_edges(v_count, edges)
+
+    return UndirectedGraph.from_edges(((str(src), str(dst), weight) for src, dst, weight in edges),
+                                      (str(vertex) for vertex in range(v_count)))
+
+
+def _open(path: str, mode: str):
+    """
+    Opens a text file, gzip-compressed if its name ends in .gz; '-' means stdin or stdout
+    :param path: string naming the file
+    :param mode: 'r' or 'w'
+    :return: open text file
+    """
+    if path == '-':
+        return sys.stdin if mode == 'r' else sys.stdout
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't')
+    return open(path, mode)
+
+
+def write_graph(path: str, edges: list, v_count: int, directed: bool) -> None:
+    """
+    Writes a graph as a header line followed by one "source destination weight" line per edge
+    :param path: string naming the file to write
+    :param edges: list of (source, destination, weight) tuples
+    :param v_count: int count of vertices
+    :param directed: True if the graph is directed
+    """
+    file = _open(path, 'w')
+    try:
+        file.write(f'# {"directed" if directed else "undirected"} {v_count}\n')
+        for src, dst, weight in edges:
+            file.write(f'{src} {dst} {weight}\n')
+    finally:
+        if file is not sys.stdout:
+            file.close()
+
+
+def read_graph(path: str):
+    """
+    Reads a graph written by write_graph()
+    :param path: string naming the file to read
+    :return: DirectedGraph or UndirectedGraph
+    """
+    with _open(path, 'r') as file:
+        _, kind, v_count = file.readline().split()
+        edges = []
+        for line in file:
+            src, dst, weight = line.split()
+            edges.append((int(src), int(dst), int(weight)))
+
+    return build_graph(edges, int(v_count), kind == 'directed')
+
+
+class TraceRecorder:
+    """
+    Class to implement a wrapper that records the operations called on a graph
+    - traced operations are forwarded to the graph and logged, one JSON array per line:
+        [seconds since recording started, operation name, arguments..., {"kw": keyword arguments}]
+        where the trailing object only appears if there were keyword arguments
+    - everything else is forwarded without being logged
+    - a call that can't be logged is still made; the failure is reported through the logging module
+    - the log is gzip-compressed if its name ends in .gz
+    """
+
+    def __init__(self, graph, path: str):
+        """
+        Starts recording
+        :param graph: DirectedGraph or UndirectedGraph to wrap
+        :param path: string naming the log file to write
+        """
+        self._graph = graph
+        self._file = _open(path, 'w')
+        self._start = time.perf_counter()
+
+    def __getattr__(self, name):
+        attribute = getattr(self._graph, name)
+        if name not in TRACED_OPS:
+            return attribute
+
+        def recorded(*args, **kwargs):
+            elapsed = round(time.perf_counter() - self._start, 6)
+            entry = [elapsed, name, *[_jsonable(arg) for arg in args]]
+            if kwargs:
+                entry.append({'kw': {key: _jsonable(value) for key, value in kwargs.items()}})
+
+            try:
+                self._file.write(json.dumps(entry) + '\n')
+            except (TypeError, ValueError, OSError) as error:
+                logger.warning('could not record %s call: %s', name, error)
+
+            return attribute(*args, **kwargs)
+
+        return recorded
+
+    def close(self) -> None:
+        """
+        Stops recording and closes the log
+        """
+        if self._file is not sys.stdout:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _jsonable(value):
+    """
+    Converts sets and tuples to lists, so operation arguments can be logged as JSON
+    :param value: argument passed to a graph method
+    :return: value JSON can encode
+    """
+    if isinstance(value, (set, frozenset, tuple)):
+        return [_jsonable(element) for element in value]
+    return value
+
+
+def synthesize_trace(graph, path: str, op_count: int, mix: dict, rate: float, seed: int = None) -> None:
+    """
+    Writes a random trace of operations against a graph, as if recorded at a steady rate
+    :param graph: DirectedGraph or UndirectedGraph the trace will be replayed against
+    :param path: string naming the log file to write
+    :param op_count: int count of operations
+    :param mix: dict of {operation name: relative frequency}
+    :param rate: number of operations per second to space the timestamps by
+    :param seed: (optional) int seed, for repeatable traces
+    """
+    rng = random.Random(seed)
+    vertices = graph.get_vertices()
+    names = sorted(mix)
+    weights = [mix[name] for name in names]
+
+    file = _open(path, 'w')
+    try:
+        for index in range(op_count):
+            op = rng.choices(names, weights)[0]
+            if op in ('add_edge', 'remove_edge', 'is_valid_path'):
+                args = [rng.choice(vertices), rng.choice(vertices)]
+                args = [args] if op == 'is_valid_path' else args
+            elif op in ('dijkstra', 'bfs', 'dfs', 'remove_vertex'):
+                args = [rng.choice(vertices)]
+            elif op == 'bounded_dijkstra':
+                args = [rng.choice(vertices), None, 10]
+            else:
+                args = []
+            file.write(json.dumps([round(index / rate, 6), op, *args]) + '\n')
+    finally:
+        if file is not sys.stdout:
+            file.close()
+
+
+def replay(graph, path: str, rate: float = None, speed: float = 1.0) -> dict:
+    """
+    Replays a trace against a graph, timing each operation
+    Latency runs from when the operation was due, not from when it started, so once the replay falls behind
+        schedule the time spent waiting counts too, as it would for a real caller at the requested rate
+    Operations the graph doesn't support, or that raise, are counted as errors
+    :param graph: DirectedGraph or UndirectedGraph to run the operations on
+    :param path: string naming the log file to read
+    :param rate: (optional) number of operations per second; if given, the recorded timestamps are ignored
+    :param speed: (optional) number scaling the recorded timestamps; 2.0 replays twice as fast. 0 means no waiting
+    :return: dict of {operation name: {'latencies': list of seconds from due to finished,
+                                       'service': list of seconds from started to finished,
+                                       'lateness': list of seconds from due to started,
+                                       'errors': int}}
+    """
+    results = {}
+    start = time.perf_counter()
+
+    with _open(path, 'r') as file:
+        for index, line in enumerate(file):
+            recorded_at, op, *args = json.loads(line)
+            result = results.setdefault(op, {'latencies': [], 'service': [], 'lateness': [], 'errors': 0})
+
+            # wait until the operation's turn, so the offered load matches the trace
+            if rate is not None:
+                due = index / rate
+            elif speed > 0:
+                due = recorded_at / speed
+            else:
+                due = None
+            scheduled = start + due if due is not None else time.perf_counter()
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            if op not in TRACED_OPS or not hasattr(graph, op):
+                result['errors'] += 1
+                continue
+
+            kwargs = {}
+            if len(args) > 0 and isinstance(args[-1], dict) and set(args[-1]) == {'kw'}:
+                kwargs = args.pop()['kw']
+
+            # a set recorded as a list goes back to a set
+            if op == 'bounded_dijkstra':
+                if len(args) > 3 and args[3] is not None:
+                    args[3] = set(args[3])
+                if kwargs.get('targets') is not None:
+                    kwargs['targets'] = set(kwargs['targets'])
+
+            began = time.perf_counter()
+            try:
+                getattr(graph, op)(*args, **kwargs)
+            except Exception as error:
+                logger.debug('replaying %s failed: %r', op, error)
+                result['errors'] += 1
+                continue
+            finished = time.perf_counter()
+            result['latencies'].append(finished - scheduled)
+            result['service'].append(finished - began)
+            result['lateness'].append(began - scheduled)
+
+    return results
+
+
+def percentile(sorted_values: list, fraction: float):
+    """
+    Returns a percentile of sorted values, by the nearest-rank method
+    :param sorted_values: non-empty list of numbers, sorted least to greatest
+    :param fraction: number from 0 to 1, like 0.99 for the 99th percentile
+    :return: the value at that rank
+    """
+    rank = max(1, int(-(-fraction * len(sorted_values) // 1)))  # ceiling
+    return sorted_values[rank - 1]
+
+
+def format_report(results: dict, elapsed: float = None) -> str:
+    """
+    Formats replay results as a table of latency percentiles, in milliseconds
+    The service column is time spent running the operation alone; the late column is time spent waiting
+        past its due time, which grows when the graph can't keep up with the requested rate
+    :param results: dict returned by replay()
+    :param elapsed: (optional) number of seconds the replay took; if given, the achieved rate is reported too
+    :return: string table, one row per operation
+    """
+    lines = ['{:<28}{:>8}{:>8}{:>10}{:>10}{:>10}{:>10}{:>13}{:>13}'.format(
+        'op', 'count', 'errors', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms', 'svc p99 ms', 'late p99 ms')]
+    for op in sorted(results):
+        latencies = sorted(results[op]['latencies'])
+        if len(latencies) == 0:
+            lines.append('{:<28}{:>8}{:>8}'.format(op, 0, results[op]['errors']))
+            continue
+        lines.append('{:<28}{:>8}{:>8}{:>10.3f}{:>10.3f}{:>10.3f}{:>10.3f}{:>13.3f}{:>13.3f}'.format(
+            op, len(latencies), results[op]['errors'],
+            *(1000 * percentile(latencies, fraction) for fraction in (0.5, 0.9, 0.99, 1.0)),
+            1000 * percentile(sorted(results[op]['service']), 0.99),
+            1000 * percentile(sorted(results[op]['lateness']), 0.99)))
+
+    if elapsed is not None:
+        count = sum(len(result['latencies']) + result['errors'] for result in results.values())
+        rate = count / elapsed if elapsed > 0 else 0
+        lines.append(f'{count} operations in {elapsed:.3f} s: {rate:.1f} ops/s achieved')
+
+    return '\n'.join(lines)
+
+
+def _parse_mix(text: str) -> dict:
+    """
+    Parses an operation mix like "dijkstra=5,bfs=2,add_edge=1"
+    :param text: string of comma-separated name=weight pairs
+    :return: dict of {operation name: weight}
+    """
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name not in TRACED_OPS:
+            raise argparse.ArgumentTypeError(f'unknown operation {name!r}')
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main(argv: list = None) -> int:
+    """
+    Runs the graph-workload command line tool
+    :param argv: (optional) list of argument strings. If not provided, sys.argv is used
+    :return: int exit status
+    """
+    parser = argparse.ArgumentParser(prog='graph-workload',
+                                     description='Generate synthetic graphs and replay traces of graph operations')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    generate = commands.add_parser('generate', help='write a synthetic graph as an edge list')
+    generate.add_argument('--kind', choices=GRAPH_KINDS, default='random')
+    generate.add_argument('--vertices', type=int, required=True)
+    generate.add_argument('--edges', type=int, default=0, help='edges wanted (ignored for grid)')
+    generate.add_argument('--directed', action='store_true')
+    generate.add_argument('--max-weight', type=int, default=10)
+    generate.add_argument('--seed', type=int)
+    generate.add_argument('-o', '--output', default='-', help='file to write; .gz to compress')
+
+    trace = commands.add_parser('trace', help='write a synthetic trace of operations against a graph')
+    trace.add_argument('--graph', required=True, help='edge list written by generate')
+    trace.add_argument('--ops', type=int, default=1000)
+    trace.add_argument('--mix', type=_parse_mix, default='dijkstra=4,bfs=3,is_valid_path=2,add_edge=1')
+    trace.add_argument('--rate', type=float, default=1000.0, help='operations per second to timestamp by')
+    trace.add_argument('--seed', type=int)
+    trace.add_argument('-o', '--output', default='-', help='file to write; .gz to compress')
+
+    replay_parser = commands.add_parser('replay', help='replay a trace and report latency percentiles')
+    replay_parser.add_argument('--graph', required=True, help='edge list written by generate')
+    replay_parser.add_argument('--trace', required=True, help='trace recorded by TraceRecorder or written by trace')
+    pacing = replay_parser.add_mutually_exclusive_group()
+    pacing.add_argument('--rate', type=float, help='operations per second, ignoring recorded timestamps')
+    pacing.add_argument('--speed', type=float, default=1.0, help='timestamp scale; 0 replays as fast as possible')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'generate':
+        began = time.perf_counter()
+        edges = generate_edges(args.kind, args.vertices, args.edges, args.seed, args.max_weight)
+        # load the edges once, so the file holds exactly the edges a graph keeps
+        graph = build_graph(edges, args.vertices, args.directed)
+        if args.directed:
+            edges = graph.get_edges()
+        else:
+            edges = [(int(src), int(dst), weight) for src, dst, weight in graph.get_weighted_edges()]
+        write_graph(args.output, edges, args.vertices, args.directed)
+        print(f'{args.kind} graph: {args.vertices} vertices, {len(edges)} edges, '
+              f'built in {time.perf_counter() - began:.3f} s', file=sys.stderr)
+
+    elif args.command == 'trace':
+        synthesize_trace(read_graph(args.graph), args.output, args.ops, args.mix, args.rate, args.seed)
+
+    else:
+        graph = read_graph(args.graph)
+        began = time.perf_counter()
+        results = replay(graph, args.trace, args.rate, args.speed)
+        print(format_report(results, time.perf_counter() - began))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
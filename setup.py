@@ -0,0 +1,23 @@
+# Builds the package. Set DSP_COMPILE=1 to also compile the graph modules to C extensions with Cython;
+# the compiled modules replace the pure-Python ones at import time, and the pure-Python ones remain the fallback.
+# Example: DSP_COMPILE=1 pip install --no-build-isolation .
+
+
+import os
+from setuptools import setup
+
+
+COMPILED_MODULES = [
+    'data_structures_portfolio/stack.py',
+    'data_structures_portfolio/d_graph.py',
+    'data_structures_portfolio/ud_graph.py',
+]
+
+ext_modules = []
+if os.environ.get('DSP_COMPILE') == '1':
+    from Cython.Build import cythonize
+
+    # Cython skips regenerating C files whose .py source hasn't changed, so rebuilds are cheap
+    ext_modules = cythonize(COMPILED_MODULES, language_level=3, nthreads=os.cpu_count() or 1)
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,94 @@
+# Course: CS261 - Data Structures
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Checks landmark selection and the distances a LandmarkIndex reports on one-way graphs
+
+
+import random
+import unittest
+
+from data_structures_portfolio.d_graph import DirectedGraph
+from data_structures_portfolio.landmark_index import LandmarkIndex
+
+
+class LandmarkIndexTest(unittest.TestCase):
+    """
+    Builds indexes on graphs with no round trips, where every vertex is cut off from a landmark in some direction
+    """
+    SIDE = 12
+    K = 6
+
+    def _grid(self) -> DirectedGraph:
+        """
+        Builds a square grid whose edges only lead right and down
+        :return: DirectedGraph where vertex row * SIDE + column is one cell
+        """
+        side = self.SIDE
+        edges = []
+        for row in range(side):
+            for column in range(side):
+                if column + 1 < side:
+                    edges.append((row * side + column, row * side + column + 1, 1))
+                if row + 1 < side:
+                    edges.append((row * side + column, (row + 1) * side + column, 1))
+        return DirectedGraph.from_edges(side * side, edges)
+
+    def _dag(self) -> DirectedGraph:
+        """
+        Builds a random graph whose edges only lead from lower to higher numbers
+        :return: DirectedGraph with no cycles
+        """
+        rng = random.Random(0)
+        edges = []
+        for _ in range(400):
+            src, dst = sorted(rng.sample(range(150), 2))
+            edges.append((src, dst, rng.randint(1, 9)))
+        return DirectedGraph.from_edges(150, edges)
+
+    def _check_distances(self, graph: DirectedGraph, index: LandmarkIndex) -> None:
+        """
+        Checks the index's bounds and A* distances against dijkstra() for a sample of vertex pairs
+        :param graph: DirectedGraph the index was built from
+        :param index: LandmarkIndex to check
+        """
+        rng = random.Random(1)
+        for _ in range(200):
+            src, dst = rng.sample(range(graph.v_count), 2)
+            expected = graph.dijkstra(src)[dst]
+            lower, upper = index.distance_bounds(src, dst)
+            self.assertLessEqual(lower, expected)
+            self.assertLessEqual(expected, upper)
+            self.assertEqual(index.distance(src, dst), expected)
+
+    def test_grid_landmarks_spread_to_the_corners(self):
+        graph = self._grid()
+        index = LandmarkIndex.build(graph, self.K)
+
+        side = self.SIDE
+        corners = {0, side - 1, side * (side - 1), side * side - 1}
+        self.assertLessEqual(corners, set(index.landmarks))
+        self._check_distances(graph, index)
+
+    def test_dag_landmarks_are_not_the_lowest_numbers(self):
+        graph = self._dag()
+        index = LandmarkIndex.build(graph, self.K)
+
+        self.assertEqual(len(set(index.landmarks)), self.K)
+        self.assertNotEqual(index.landmarks, list(range(self.K)))
+        self._check_distances(graph, index)
+
+    def test_vertices_outside_the_graph_are_rejected(self):
+        index = LandmarkIndex.build(self._dag(), self.K)
+        for src, dst in [(-1, 2), (0, 150), (150, 0)]:
+            with self.assertRaises(ValueError):
+                index.distance_bounds(src, dst)
+            with self.assertRaises(ValueError):
+                index.distance(src, dst)
+
+        empty = LandmarkIndex.build(DirectedGraph(), self.K)
+        with self.assertRaises(ValueError):
+            empty.distance_bounds(0, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
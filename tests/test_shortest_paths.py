@@ -0,0 +1,118 @@
+# Course: CS261 - Data Structures
+# Author: Mark Mendez
+# Assignment: 6
+# Description: Randomized checks that the incrementally maintained shortest paths match a fresh Dijkstra run
+
+
+import random
+import unittest
+
+from data_structures_portfolio.d_graph import DirectedGraph, ShortestPathTree
+
+
+class IncrementalShortestPathsTest(unittest.TestCase):
+    """
+    Applies random sequences of changes to a DirectedGraph and compares, after every change,
+        the ShortestPathTree and the dijkstra() cache against freeze().dijkstra()
+    """
+    SEEDS = range(40)
+    STEPS = 60
+
+    def _random_graph(self, rng: random.Random) -> DirectedGraph:
+        """
+        Builds a small random graph
+        :param rng: random.Random to draw from
+        :return: DirectedGraph with 2 to 8 vertices
+        """
+        graph = DirectedGraph()
+        for _ in range(rng.randint(2, 8)):
+            graph.add_vertex()
+        for _ in range(rng.randint(0, graph.v_count * 2)):
+            src, dst = rng.sample(range(graph.v_count), 2)
+            graph.add_edge(src, dst, rng.randint(1, 9))
+        return graph
+
+    def _random_change(self, rng: random.Random, graph: DirectedGraph) -> None:
+        """
+        Applies one random change to a graph
+        :param rng: random.Random to draw from
+        :param graph: DirectedGraph to change
+        """
+        src, dst = rng.sample(range(graph.v_count), 2)
+        change = rng.choices(['add', 'remove', 'reweight', 'add_vertex'], [4, 3, 3, 1])[0]
+
+        if change == 'add':
+            graph.add_edge(src, dst, rng.randint(1, 9))
+        elif change == 'remove':
+            edges = graph.get_edges()
+            if len(edges) > 0:
+                src, dst, _ = rng.choice(edges)
+            graph.remove_edge(src, dst)
+        elif change == 'reweight':
+            edges = graph.get_edges()
+            if len(edges) > 0:
+                src, dst, _ = rng.choice(edges)
+                graph.add_edge(src, dst, rng.randint(1, 9))
+        else:
+            graph.add_vertex()
+
+    def _check_path(self, graph: DirectedGraph, tree: ShortestPathTree, vertex: int) -> None:
+        """
+        Checks that the tree's path to a vertex exists in the graph and has the tree's length
+        :param graph: DirectedGraph the tree follows
+        :param tree: ShortestPathTree to check
+        :param vertex: int identifying a vertex
+        """
+        path = tree.path_to(vertex)
+        if tree.distance(vertex) == float('inf'):
+            self.assertEqual(path, [])
+            return
+
+        self.assertEqual(path[0], tree.src)
+        self.assertEqual(path[-1], vertex)
+        self.assertEqual(sum(graph.adj_matrix[path[index]][path[index + 1]] for index in range(len(path) - 1)),
+                         tree.distance(vertex))
+
+    def test_tree_and_cache_match_fresh_dijkstra(self):
+        for seed in self.SEEDS:
+            with self.subTest(seed=seed):
+                rng = random.Random(seed)
+                graph = self._random_graph(rng)
+                tree = ShortestPathTree(graph, rng.randrange(graph.v_count))
+                graph.enable_dijkstra_cache(max_entries=3)
+
+                for _ in range(self.STEPS):
+                    self._random_change(rng, graph)
+                    snapshot = graph.freeze()
+
+                    self.assertEqual(tree.distances(), snapshot.dijkstra(tree.src))
+                    for vertex in range(graph.v_count):
+                        self._check_path(graph, tree, vertex)
+
+                    # ask twice, so both a freshly computed and a cached answer are checked
+                    for src in rng.sample(range(graph.v_count), min(3, graph.v_count)):
+                        self.assertEqual(graph.dijkstra(src), snapshot.dijkstra(src))
+                        self.assertEqual(graph.dijkstra(src), snapshot.dijkstra(src))
+
+                tree.detach()
+
+    def test_reordered_snapshot_keeps_distances(self):
+        for seed in self.SEEDS:
+            with self.subTest(seed=seed):
+                rng = random.Random(seed)
+                graph = self._random_graph(rng)
+                before = [graph.dijkstra(src) for src in range(graph.v_count)]
+
+                snapshot, order = graph.reorder(rng.choice(['bfs', 'rcm', 'degree']))
+
+                # the graph keeps its numbering, and the snapshot agrees once translated through order
+                self.assertEqual(sorted(order), list(range(graph.v_count)))
+                for vertex, old_vertex in enumerate(order):
+                    self.assertEqual(graph.dijkstra(old_vertex), before[old_vertex])
+                    distances = snapshot.dijkstra(vertex)
+                    self.assertEqual([distances[order.index(dst)] for dst in range(graph.v_count)],
+                                     before[old_vertex])
+
+
+if __name__ == '__main__':
+    unittest.main()